@@ -1,43 +1,139 @@
 # apriori_hackathon.py
+from functools import partial
+
+import numpy as np
 import pandas as pd
-from mlxtend.frequent_patterns import apriori, association_rules
 
+from basket import build_basket_from_chunks, frequent_itemsets
+from ingest import read_chunks
+from output import write_table
+from packaging_index import write_index
+from profiling import NO_PROFILE
+from rules import encode_itemsets, rule_maxima, top_rule_maxima
+from sampling import estimate_packaging, sampled_itemsets
+from son import son_itemsets
+
+
+def read_transaksi(input_xlsx_path: str, dtype=None):
+    # Baca data per potongan, hanya kolom yang dibutuhkan
+    for chunk in read_chunks(input_xlsx_path, sheet_name="Transaksi", columns=["Kode Transaksi", "Nama Produk"],
+                             dtype=dtype):
+        chunk = chunk.dropna()
+        yield chunk["Kode Transaksi"], chunk["Nama Produk"].astype(str).str.strip()
+
+
+def build_packaging(itemsets: pd.DataFrame, min_threshold: float = 0.4, top_k: int = None):
+    # Association rules dari frequent itemset, lalu digabung per set produk.
+    # Itemset diolah sebagai id integer; nama produk baru di-decode untuk baris output
+    if itemsets.empty:
+        return None
+    enc = encode_itemsets(itemsets)
+    if top_k is not None:
+        # Hanya top_k set teratas: heap terbatas + pruning batas atas lift (sudah terurut)
+        rows, max_lift, max_conf = top_rule_maxima(enc, top_k, min_threshold=min_threshold)
+    else:
+        rows, max_lift, max_conf = rule_maxima(enc, min_threshold=min_threshold)
 
-def run_analysis(input_xlsx_path: str, output_xlsx_path: str) -> None:
-    # 1. Baca data
-    df = pd.read_excel(input_xlsx_path, sheet_name="Transaksi")
-    df = df.rename(columns=lambda x: x.strip().lower())
-    df = df.rename(columns={"kode transaksi": "Kode Transaksi", "nama produk": "Nama Produk"})
-    df = df[["Kode Transaksi", "Nama Produk"]].dropna().drop_duplicates()
-    df["Nama Produk"] = df["Nama Produk"].astype(str).str.strip()
+    if len(rows) == 0:
+        return None
 
-    # 2. Buat basket (0/1)
-    basket = pd.crosstab(df["Kode Transaksi"], df["Nama Produk"]).astype(bool).astype(int)
+    # Urutkan berdasarkan lift lalu confidence (menurun); seri diputus menurut nama
+    # produk sehingga tabel sama untuk apriori, eclat dan fpgrowth
+    order = np.lexsort((enc.name_rank()[rows], -max_conf, -max_lift))
+    rows, max_lift, max_conf = rows[order], max_lift[order], max_conf[order]
 
-    # 3. Jalankan Apriori + Association Rules
-    itemsets = apriori(basket, min_support=0.05, use_colnames=True)
-    rules = association_rules(itemsets, metric="confidence", min_threshold=0.4)
+    # Format output
+    return pd.DataFrame({
+        "Packaging Set ID": np.arange(1, len(rows) + 1),
+        "Products": enc.names(rows),
+        "Maximum_Lift": max_lift,
+        "Maximum_Confidence": max_conf,
+    })
 
-    if rules.empty:
+
+def write_packaging(packaging, output_xlsx_path: str, output_format: str = None) -> None:
+    if packaging is None:
         print("Tidak ada kombinasi yang memenuhi kriteria.")
         return
-
-    # 4. Gabungkan antecedents dan consequents
-    rules["union_set"] = rules.apply(lambda r: frozenset(r["antecedents"].union(r["consequents"])), axis=1)
-    grouped = (
-        rules.groupby(rules["union_set"])
-        .agg(Maximum_Lift=("lift", "max"), Maximum_Confidence=("confidence", "max"))
-        .reset_index()
-    )
-
-    # 5. Format output
-    grouped["Products"] = grouped["union_set"].apply(lambda x: ";".join(sorted(x)))
-    grouped = grouped[["Products", "Maximum_Lift", "Maximum_Confidence"]]
-    grouped = grouped.sort_values(by=["Maximum_Lift", "Maximum_Confidence"], ascending=[False, False])
-    grouped.insert(0, "Packaging Set ID", range(1, len(grouped) + 1))
-    grouped.to_excel(output_xlsx_path, sheet_name = 'Packaging', index=False)
+    write_table(packaging, output_xlsx_path, sheet_name='Packaging', output_format=output_format)
     print(f"[OK] Hasil disimpan ke: {output_xlsx_path}")
 
 
+def run_analysis(input_xlsx_path: str, output_xlsx_path: str, min_support: float = 0.05, algorithm: str = "apriori", output_format: str = None, top_k: int = None,
+                 sample_epsilon: float = None, sample_delta: float = 0.05, verify_sample: bool = False, profile=None,
+                 workers: int = 1, index_path: str = None) -> None:
+    if sample_epsilon is not None:
+        # Mode sampel: lihat run_sampled_analysis
+        return run_sampled_analysis(input_xlsx_path, output_xlsx_path, min_support, sample_epsilon, sample_delta,
+                                    verify_sample, output_format, top_k, profile, index_path)
+
+    # `profile`: StageProfiler opsional untuk waktu/memori per tahap (lihat profiling.py)
+    prof = profile or NO_PROFILE
+    with prof.run("packaging"):
+        # 1-2. Baca data lalu buat basket dalam bentuk bitset per produk (bukan matrix int64 padat)
+        chunks = prof.iter("read", read_transaksi(input_xlsx_path), rows=_chunk_rows)
+        with prof.stage("basket") as stage:
+            basket = build_basket_from_chunks(prof.count_in("basket", chunks, rows=_chunk_rows))
+            stage.add_rows(rows_out=basket.n_transaksi)
+
+        # 3. Cari frequent itemset (apriori / fpgrowth / eclat) + Association Rules;
+        # dengan workers > 1 partisi transaksi ditambang paralel (SON, hasil sama dengan serial)
+        with prof.stage("mining", rows_in=basket.n_transaksi) as stage:
+            if workers > 1:
+                itemsets = son_itemsets(basket, min_support=min_support, workers=workers, algorithm=algorithm)
+            else:
+                itemsets = frequent_itemsets(basket, min_support=min_support, algorithm=algorithm)
+            stage.add_rows(rows_out=len(itemsets))
+
+        # 4-5. Gabungkan antecedents dan consequents, format dan simpan output
+        _rules_and_write(prof, itemsets, partial(build_packaging, itemsets, top_k=top_k), output_xlsx_path, output_format,
+                         index_path)
+
+
+def _chunk_rows(chunk) -> int:
+    # Potongan read_transaksi berupa (kode, produk)
+    return len(chunk[0])
+
+
+def _rules_and_write(prof, itemsets, build, output_xlsx_path, output_format, index_path=None) -> None:
+    with prof.stage("rules", rows_in=len(itemsets)) as stage:
+        packaging = build()
+        stage.add_rows(rows_out=0 if packaging is None else len(packaging))
+    with prof.stage("write", rows_in=stage.rows_out):
+        write_packaging(packaging, output_xlsx_path, output_format)
+
+    # Index produk -> set packaging untuk lookup cepat (lihat packaging_index.py)
+    if index_path is not None and packaging is not None:
+        with prof.stage("index", rows_in=len(packaging)):
+            write_index(packaging, index_path)
+        print(f"[OK] Index packaging disimpan ke: {index_path}")
+
+
+def run_sampled_analysis(input_xlsx_path: str, output_xlsx_path: str, min_support: float = 0.05, epsilon: float = 0.01, delta: float = 0.05,
+                         verify: bool = False, output_format: str = None, top_k: int = None, profile=None,
+                         index_path: str = None) -> dict:
+    # Mining atas sampel transaksi (Toivonen) untuk eksplorasi cepat. Tanpa verify hasilnya
+    # estimasi dengan interval kepercayaan; dengan verify file dibaca sekali lagi untuk hitungan exact
+    prof = profile or NO_PROFILE
+    with prof.run("packaging"):
+        chunks = prof.iter("read", read_transaksi(input_xlsx_path), rows=_chunk_rows)
+        verify_chunks = prof.iter("read", read_transaksi(input_xlsx_path), rows=_chunk_rows) if verify else None
+        with prof.stage("sampling") as stage:
+            itemsets, report = sampled_itemsets(chunks, min_support, epsilon, delta, verify_chunks=verify_chunks)
+            stage.add_rows(rows_in=report.get("n_transaksi"), rows_out=len(itemsets))
+        if verify:
+            build = partial(build_packaging, itemsets, top_k=top_k)
+        else:
+            build = partial(estimate_packaging, itemsets, report["sample_transaksi"], delta, top_k=top_k)
+        if verify and report["border_frequent"]:
+            print(f"[PERINGATAN] {report['border_frequent']} itemset di luar sampel ternyata frequent; "
+                  "hasil mungkin belum lengkap, perbesar sampel (epsilon lebih kecil) atau jalankan tanpa sampel.")
+        print(f"[SAMPEL] {report['sample_transaksi']} transaksi (epsilon={epsilon}, delta={delta}), "
+              f"{report['kandidat']} kandidat itemset" + (", terverifikasi exact" if verify else ""))
+        _rules_and_write(prof, itemsets, build, output_xlsx_path, output_format, index_path)
+    return report
+
+
 # Contoh pemanggilan langsung:
-run_analysis("transaksi_dqmart.xlsx", "product_packaging.xlsx")
\ No newline at end of file
+if __name__ == "__main__":
+    run_analysis("transaksi_dqmart.xlsx", "product_packaging.xlsx")
@@ -0,0 +1,251 @@
+# basket.py
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+
+# Hitung jumlah bit 1 per baris (popcount) pada array uint64
+if hasattr(np, "bitwise_count"):
+    def popcount(bits):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+else:
+    _POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(bits):
+        bits = np.ascontiguousarray(bits)
+        return _POPCOUNT_8[bits.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+@dataclass
+class Basket:
+    # Basket dalam bentuk bitset: satu baris uint64 per produk,
+    # bit ke-(offset + t) bernilai 1 jika produk dibeli pada transaksi ke-t
+    # (offset > 0 hanya untuk Basket.window yang tidak mulai di batas word)
+    products: np.ndarray
+    bits: np.ndarray
+    n_transaksi: int
+    offset: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.bits.nbytes)
+
+    def support_count(self, itemset) -> int:
+        # Support count = popcount dari AND bitset semua produk di itemset
+        itemset = list(itemset)
+        acc = self.bits[itemset[0]].copy()
+        for i in itemset[1:]:
+            np.bitwise_and(acc, self.bits[i], out=acc)
+        return int(popcount(acc))
+
+    def window(self, lo: int, hi: int) -> "Basket":
+        # Basket untuk transaksi ke-lo s.d. hi-1 saja: potongan kolom word bitset,
+        # bit di luar rentang pada word tepi dinolkan. Transaksi ke-lo tetap di bit
+        # lo % 64 dari word pertama, dicatat sebagai offset
+        n_transaksi = max(hi - lo, 0)
+        lo, hi = lo + self.offset, hi + self.offset
+        bits = self.bits[:, lo // 64:(hi + 63) // 64].copy()
+        if bits.shape[1]:
+            bits[:, 0] &= ~np.uint64((1 << (lo % 64)) - 1)
+            if hi % 64:
+                bits[:, -1] &= np.uint64((1 << (hi % 64)) - 1)
+        return Basket(products=self.products, bits=bits, n_transaksi=n_transaksi, offset=lo % 64)
+
+
+def _pack_bits(tid, pid, n_transaksi: int, n_produk: int) -> np.ndarray:
+    # Set bit (produk, transaksi) -- duplikat otomatis tergabung oleh OR
+    n_words = max((n_transaksi + 63) // 64, 1)
+    bits = np.zeros((n_produk, n_words), dtype=np.uint64)
+    mask = np.left_shift(np.uint64(1), (tid & 63).astype(np.uint64))
+    np.bitwise_or.at(bits, (pid, tid >> 6), mask)
+    return bits
+
+
+def build_basket(kode_transaksi, nama_produk) -> Basket:
+    # 1. Ubah kode transaksi dan nama produk menjadi id integer
+    tid, _ = pd.factorize(pd.Series(kode_transaksi).to_numpy())
+    pid, products = pd.factorize(pd.Series(nama_produk).to_numpy(), sort=True)
+    valid = (tid >= 0) & (pid >= 0)
+    tid, pid = tid[valid].astype(np.int64), pid[valid]
+
+    # 2. Bangun bitset per produk
+    n_transaksi = int(tid.max()) + 1 if len(tid) else 0
+    bits = _pack_bits(tid, pid, n_transaksi, len(products))
+    return Basket(products=np.asarray(products, dtype=object), bits=bits, n_transaksi=n_transaksi)
+
+
+def build_basket_sorted(kode_transaksi, nama_produk, key):
+    # Seperti build_basket, tetapi id transaksi diurutkan menurut `key` (mis. tanggal;
+    # nilai pertama per transaksi yang dipakai). Transaksi dengan key berdekatan
+    # menempati word bitset yang berdekatan, jadi satu rentang key = Basket.window.
+    # Mengembalikan (basket, key per transaksi sesuai urutan id)
+    kode = pd.Series(kode_transaksi).to_numpy(dtype=object)
+    produk = pd.Series(nama_produk).to_numpy(dtype=object)
+    key = pd.Series(key).to_numpy()
+    valid = ~(pd.isna(kode) | pd.isna(produk) | pd.isna(key))
+    tid, _ = pd.factorize(kode[valid])
+    pid, products = pd.factorize(produk[valid], sort=True)
+
+    tkey = pd.Series(key[valid]).groupby(tid, sort=True).first().to_numpy()
+    order = np.argsort(tkey, kind="stable")
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    bits = _pack_bits(rank[tid], pid, len(order), len(products))
+    return Basket(products=np.asarray(products, dtype=object), bits=bits, n_transaksi=len(order)), tkey[order]
+
+
+def _extend_codes(index: pd.Index, values):
+    # Id integer untuk `values`, menambahkan nilai baru ke ujung index
+    codes = index.get_indexer(values)
+    if (codes < 0).any():
+        index = index.append(pd.Index(pd.unique(values[codes < 0])))
+        codes = index.get_indexer(values)
+    return index, codes
+
+
+def build_basket_from_chunks(chunks) -> Basket:
+    # Sama dengan build_basket, tetapi input berupa potongan (kode, produk)
+    # sehingga hanya id integer yang disimpan selama file dibaca
+    kode_index, produk_index = pd.Index([], dtype=object), pd.Index([], dtype=object)
+    tids, pids = [], []
+    for kode_transaksi, nama_produk in chunks:
+        kode = pd.Series(kode_transaksi).to_numpy(dtype=object)
+        produk = pd.Series(nama_produk).to_numpy(dtype=object)
+        valid = ~(pd.isna(kode) | pd.isna(produk))
+        kode_index, tid = _extend_codes(kode_index, kode[valid])
+        produk_index, pid = _extend_codes(produk_index, produk[valid])
+        tids.append(tid.astype(np.int64))
+        pids.append(pid.astype(np.int64))
+
+    # Urutkan produk berdasarkan nama seperti pd.factorize(sort=True)
+    order = np.argsort(produk_index.to_numpy(), kind="stable")
+    remap = np.empty(len(order), dtype=np.int64)
+    remap[order] = np.arange(len(order))
+    tid = np.concatenate(tids) if tids else np.empty(0, dtype=np.int64)
+    pid = remap[np.concatenate(pids)] if pids else np.empty(0, dtype=np.int64)
+
+    bits = _pack_bits(tid, pid, len(kode_index), len(produk_index))
+    return Basket(products=produk_index.to_numpy()[order], bits=bits, n_transaksi=len(kode_index))
+
+
+def iter_apriori(basket: Basket, min_support: float, max_len=None):
+    # Apriori level-wise di atas bitset: hasil di-yield per itemset sebagai
+    # (support, tuple id produk) sehingga itemset pertama keluar secepatnya
+    if basket.n_transaksi == 0:
+        return
+    min_count = min_support * basket.n_transaksi
+
+    # Level 1
+    counts = popcount(basket.bits)
+    frequent = {}
+    for i in np.flatnonzero(counts >= min_count):
+        frequent[(int(i),)] = basket.bits[i]
+        yield counts[i] / basket.n_transaksi, (int(i),)
+
+    k = 2
+    while frequent and (max_len is None or k <= max_len):
+        # Kelompokkan itemset level k-1 berdasarkan prefix k-2 item
+        prefixes = {}
+        for itemset in sorted(frequent):
+            prefixes.setdefault(itemset[:-1], []).append(itemset[-1])
+
+        next_frequent = {}
+        for prefix, tails in prefixes.items():
+            for j, a in enumerate(tails[:-1]):
+                left = prefix + (a,)
+                # Pruning: semua subset ukuran k-1 harus frequent
+                cands = [
+                    b for b in tails[j + 1:]
+                    if all(left[:m] + left[m + 1:] + (b,) in frequent for m in range(k - 2))
+                ]
+                if not cands:
+                    continue
+                anded = np.bitwise_and(frequent[left][None, :], basket.bits[cands])
+                cand_counts = popcount(anded)
+                for b, row, c in zip(cands, anded, cand_counts):
+                    if c >= min_count:
+                        itemset = left + (b,)
+                        next_frequent[itemset] = row
+                        yield c / basket.n_transaksi, itemset
+        frequent = next_frequent
+        k += 1
+
+
+def iter_eclat(basket: Basket, min_support: float, max_len=None):
+    # ECLAT: penelusuran depth-first di atas tid-list vertikal (bitset),
+    # tanpa membangkitkan kandidat per level seperti apriori
+    if basket.n_transaksi == 0:
+        return
+    min_count = min_support * basket.n_transaksi
+    counts = popcount(basket.bits)
+    items = [int(i) for i in np.flatnonzero(counts >= min_count)]
+
+    # Stack berisi (prefix, bitset prefix, item kandidat perluasan)
+    stack = []
+    for j, i in enumerate(items):
+        yield counts[i] / basket.n_transaksi, (i,)
+        stack.append(((i,), basket.bits[i], items[j + 1:]))
+
+    while stack:
+        prefix, prefix_bits, tails = stack.pop()
+        if not tails or (max_len is not None and len(prefix) >= max_len):
+            continue
+        anded = np.bitwise_and(prefix_bits[None, :], basket.bits[tails])
+        tail_counts = popcount(anded)
+        keep = np.flatnonzero(tail_counts >= min_count)
+        ext = [tails[j] for j in keep]
+        for n, j in enumerate(keep):
+            itemset = prefix + (tails[j],)
+            yield tail_counts[j] / basket.n_transaksi, itemset
+            stack.append((itemset, anded[j], ext[n + 1:]))
+
+
+def count_itemsets(basket, itemsets: list, block: int = 4096) -> np.ndarray:
+    # Support count exact untuk banyak itemset sekaligus, per ukuran dan per blok;
+    # blok diperkecil untuk basket besar agar bitset sementara tetap <= ~64 MiB
+    block = max(1, min(block, (64 << 20) // (8 * max(basket.bits.shape[1], 1))))
+    counts = np.zeros(len(itemsets), dtype=np.int64)
+    by_len = {}
+    for i, itemset in enumerate(itemsets):
+        by_len.setdefault(len(itemset), []).append(i)
+    for k, pos in by_len.items():
+        pos = np.asarray(pos)
+        ids = np.asarray([itemsets[i] for i in pos], dtype=np.int64).reshape(len(pos), k)
+        for start in range(0, len(pos), block):
+            part = ids[start:start + block]
+            acc = basket.bits[part[:, 0]].copy()
+            for j in range(1, k):
+                np.bitwise_and(acc, basket.bits[part[:, j]], out=acc)
+            counts[pos[start:start + block]] = popcount(acc)
+    return counts
+
+
+def to_sparse_frame(basket: Basket) -> pd.DataFrame:
+    # Basket one-hot dalam bentuk DataFrame sparse bool (input mlxtend)
+    columns = {}
+    for name, row in zip(basket.products, basket.bits):
+        dense = np.unpackbits(row.view(np.uint8), bitorder="little")[basket.offset:basket.offset + basket.n_transaksi]
+        columns[name] = pd.arrays.SparseArray(dense.astype(bool), fill_value=False)
+    return pd.DataFrame(columns)
+
+
+ALGORITHMS = ("apriori", "fpgrowth", "eclat")
+
+
+def frequent_itemsets(basket: Basket, min_support: float, max_len=None, algorithm: str = "apriori") -> pd.DataFrame:
+    # Hasil dalam format yang sama dengan mlxtend apriori(use_colnames=True)
+    if algorithm == "fpgrowth":
+        from mlxtend.frequent_patterns import fpgrowth
+        if basket.n_transaksi == 0:
+            return pd.DataFrame(columns=["support", "itemsets"])
+        return fpgrowth(to_sparse_frame(basket), min_support=min_support, use_colnames=True, max_len=max_len)
+
+    if algorithm == "apriori":
+        mined = iter_apriori(basket, min_support, max_len)
+    elif algorithm == "eclat":
+        mined = iter_eclat(basket, min_support, max_len)
+    else:
+        raise ValueError(f"Algoritma '{algorithm}' tidak dikenal, pilih salah satu dari {ALGORITHMS}.")
+
+    rows = [(support, frozenset(basket.products[list(itemset)])) for support, itemset in mined]
+    return pd.DataFrame(rows, columns=["support", "itemsets"])
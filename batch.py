@@ -0,0 +1,147 @@
+# batch.py
+# Contoh: python batch.py packaging "data/toko_*.xlsx" --output-dir hasil --workers 4
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+from functools import partial
+
+# Nama pipeline -> (modul, fungsi, akhiran nama file output)
+PIPELINES = {
+    "dates": ("date_standardization", "normalize_tanggal_transaksi", "_normalized"),
+    "keterangan": ("parse_and_map", "process_excel", "_output"),
+    "packaging": ("apriori_hackathon", "run_analysis", "_packaging"),
+    "windowed": ("windows", "run_windowed_analysis", "_packaging_window"),
+}
+
+# Opsi CLI yang hanya diterima pipeline tertentu (opsi lain berlaku untuk semua)
+_OPSI_KHUSUS = {
+    "min_support": ("packaging", "windowed"),
+    "algorithm": ("packaging", "windowed"),
+    "top_k": ("packaging", "windowed"),
+    "sample_epsilon": ("packaging",),
+    "freq": ("windowed",),
+}
+
+
+def find_inputs(pattern: str) -> list:
+    # Terima direktori (semua file xlsx/csv di dalamnya) atau pola glob
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*")
+    files = sorted(glob.glob(pattern))
+    return [f for f in files if os.path.splitext(f)[1].lower() in (".xlsx", ".csv")
+            and not os.path.basename(f).startswith("~$")]
+
+
+def output_path_for(input_path: str, pipeline: str, output_dir: str, output_format: str = None) -> str:
+    # <nama input><akhiran pipeline>.<format> di dalam output_dir
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, f"{stem}{PIPELINES[pipeline][2]}.{output_format or 'xlsx'}")
+
+
+def _run_one(input_path: str, pipeline: str, output_dir: str, options: dict) -> dict:
+    # Modul pipeline baru di-import di sini, jadi mlxtend hanya dimuat untuk packaging
+    module, func, _ = PIPELINES[pipeline]
+    run = getattr(importlib.import_module(module), func)
+    output_path = output_path_for(input_path, pipeline, output_dir, options.get("output_format"))
+
+    # Profil per tahap (lihat profiling.py) ikut disimpan di ringkasan batch
+    # profile_hook selalu diambil dari options (bukan parameter pipeline); hook saja
+    # tanpa profile tetap berarti profil aktif
+    options = dict(options)
+    hook = options.pop("profile_hook", None)
+    prof = None
+    if options.pop("profile", False) or hook:
+        from profiling import StageProfiler
+        prof = options["profile"] = StageProfiler(hook=hook)
+
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        run(input_path, output_path, **options)
+        status, error = "ok", None
+    except Exception as e:  # satu file rusak tidak menghentikan seluruh batch
+        status, error = "gagal", f"{type(e).__name__}: {e}"
+    result = {
+        "input": input_path,
+        "output": output_path if status == "ok" else None,
+        "status": status,
+        "error": error,
+        "seconds": round(time.perf_counter() - start, 4),
+        "cpu_seconds": round(time.process_time() - cpu_start, 4),
+    }
+    if prof is not None:
+        result["profile"] = prof.report()
+    return result
+
+
+def run_batch(inputs, pipeline: str, output_dir: str, workers: int = 1, **options) -> dict:
+    """Jalankan satu pipeline untuk banyak file toko dalam satu proses (plus worker pool)."""
+    from parallel import imap_ordered
+
+    if pipeline not in PIPELINES:
+        raise ValueError(f"Pipeline '{pipeline}' tidak dikenal, pilih salah satu dari {list(PIPELINES)}.")
+    files = find_inputs(inputs) if isinstance(inputs, str) else list(inputs)
+    os.makedirs(output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    task = partial(_run_one, pipeline=pipeline, output_dir=output_dir, options=options)
+    results = list(imap_ordered(task, files, workers))
+    summary = {
+        "pipeline": pipeline,
+        "workers": workers,
+        "files": len(results),
+        "failed": sum(r["status"] != "ok" for r in results),
+        "seconds": round(time.perf_counter() - start, 4),
+        "results": results,
+    }
+
+    # Ringkasan run disimpan di samping output per file
+    with open(os.path.join(output_dir, f"ringkasan_batch_{pipeline}.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pipeline", choices=list(PIPELINES))
+    parser.add_argument("inputs", help="direktori atau pola glob file toko")
+    parser.add_argument("--output-dir", default="hasil_batch")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--format", dest="output_format", choices=["xlsx", "csv", "parquet"], help="format file output")
+    parser.add_argument("--min-support", type=float, help="khusus packaging/windowed")
+    parser.add_argument("--algorithm", help="khusus packaging/windowed: apriori, fpgrowth atau eclat")
+    parser.add_argument("--top-k", type=int, help="khusus packaging/windowed: hanya K set teratas")
+    parser.add_argument("--sample-epsilon", type=float, help="khusus packaging: mode sampel dengan toleransi error ini")
+    parser.add_argument("--freq", help="khusus windowed: periode jendela (W, M, Q, ...)")
+    parser.add_argument("--profile", action="store_true", help="catat waktu, CPU, RSS dan baris per tahap")
+    parser.add_argument("--profile-hook", choices=["cprofile", "tracemalloc"], help="hook profiler tambahan (mengaktifkan --profile)")
+    args = parser.parse_args()
+    args.profile = args.profile or args.profile_hook is not None
+    if args.profile and args.pipeline == "windowed":
+        parser.error("--profile belum tersedia untuk pipeline windowed")
+
+    options = {k: v for k, v in (("min_support", args.min_support), ("algorithm", args.algorithm),
+                                 ("output_format", args.output_format), ("top_k", args.top_k), ("freq", args.freq),
+                                 ("sample_epsilon", args.sample_epsilon), ("profile_hook", args.profile_hook)) if v is not None}
+    for name in options:
+        if args.pipeline not in _OPSI_KHUSUS.get(name, PIPELINES):
+            parser.error(f"--{name.replace('_', '-')} hanya untuk pipeline {'/'.join(_OPSI_KHUSUS[name])}")
+    if args.profile:
+        options["profile"] = True
+    summary = run_batch(args.inputs, args.pipeline, args.output_dir, args.workers, **options)
+    for r in summary["results"]:
+        print(f"[{r['status'].upper()}] {r['input']} ({r['seconds']:.2f} s) {r['error'] or r['output']}")
+        for s in r.get("profile", {}).get("stages", []):
+            print(f"    {s['stage']:<10} {s['wall_s']:8.3f} s  cpu {s['cpu_s']:8.3f} s  "
+                  f"baris {s['rows_in']} -> {s['rows_out']}  RSS {s['peak_rss_mib']:.1f} MiB")
+    print(f"{summary['files']} file, {summary['failed']} gagal, total {summary['seconds']:.2f} s")
+    if summary["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
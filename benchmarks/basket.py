@@ -0,0 +1,46 @@
+# benchmarks/basket.py
+# Jalankan dari root repo: python -m benchmarks.basket --transaksi 1000000
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from basket import build_basket, iter_apriori
+from benchmarks.generators import synthetic_transactions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transaksi", type=int, default=1_000_000)
+    parser.add_argument("--produk", type=int, default=2000)
+    parser.add_argument("--min-support", type=float, default=0.005)
+    args = parser.parse_args()
+
+    df = synthetic_transactions(args.transaksi, args.produk)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    basket = build_basket(df["Kode Transaksi"], df["Nama Produk"])
+    t_basket = time.perf_counter() - start
+
+    itemsets = iter_apriori(basket, args.min_support)
+    next(itemsets, None)
+    t_first = time.perf_counter() - start
+    n_itemsets = 1 + sum(1 for _ in itemsets)
+    t_total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    dense = basket.n_transaksi * len(basket.products) * np.dtype(np.int64).itemsize
+    print(f"transaksi            : {basket.n_transaksi:,}")
+    print(f"produk               : {len(basket.products):,}")
+    print(f"bitset basket        : {basket.nbytes / 2**20:,.1f} MiB (crosstab int64: {dense / 2**20:,.1f} MiB)")
+    print(f"peak memory          : {peak / 2**20:,.1f} MiB")
+    print(f"build basket         : {t_basket:.3f} s")
+    print(f"time-to-first-itemset: {t_first:.3f} s")
+    print(f"semua itemset ({n_itemsets:,}) : {t_total:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
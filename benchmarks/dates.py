@@ -0,0 +1,108 @@
+# benchmarks/dates.py
+# Jalankan dari root repo: python -m benchmarks.dates --baris 1000000
+import argparse
+import tempfile
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import schema_profile
+from benchmarks.generators import messy_dates, synthetic_dates
+from date_standardization import (_clean_fix_date, _detect_date_columns, _fix_date_pandas, _parse_fix_date, fix_date,
+                                  normalize_dates, parse_stats, reset_parse_stats)
+from parse_cache import DEFAULT_MAXSIZE, get_cache
+
+
+def _deteksi_skalar(df: pd.DataFrame) -> list:
+    # Deteksi lama: pd.to_datetime skalar pada 20 nilai pertama setiap kolom
+    date_cols = []
+    for col in df.columns:
+        sample = df[col].dropna().astype(str).head(20)
+        if sample.apply(lambda x: pd.to_datetime(x, errors='coerce')).notna().sum() >= 3:
+            date_cols.append(col)
+    return date_cols
+
+
+def _ekspor_lebar(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    # Ekspor 60 kolom: 50 angka, 5 tanggal berantakan, 5 teks
+    rng = np.random.default_rng(seed)
+    cols = {f"Angka {i}": rng.integers(0, 100_000, n_rows).astype(str) for i in range(50)}
+    cols.update({f"Tanggal {i}": messy_dates(n_rows, seed=i).to_numpy() for i in range(5)})
+    cols.update({f"Produk {i}": np.array(["Roti", "Susu", "Telur"])[rng.integers(0, 3, n_rows)] for i in range(5)})
+    return pd.DataFrame(cols)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baris", type=int, default=1_000_000)
+    parser.add_argument("--sampel-fix-date", type=int, default=20_000)
+    parser.add_argument("--baris-deteksi", type=int, default=100_000)
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+
+    values = synthetic_dates(args.baris)
+
+    start = time.perf_counter()
+    hasil = normalize_dates(values)
+    t_vector = time.perf_counter() - start
+
+    # fix_date per sel terlalu lambat untuk 1M baris: ukur pada sampel lalu
+    # ekstrapolasi, dengan cache dimatikan agar setiap sel benar-benar di-parse
+    sample = values.head(args.sampel_fix_date)
+    cache = get_cache("fix_date")
+    cache.resize(0)
+    start = time.perf_counter()
+    expected = sample.apply(fix_date)
+    t_sample = time.perf_counter() - start
+    cache.resize(DEFAULT_MAXSIZE)
+    t_apply = t_sample * len(values) / len(sample)
+
+    print(f"baris                 : {len(values):,} ({values.nunique():,} unik)")
+    print(f"normalize_dates       : {t_vector:.2f} s ({len(values) / t_vector:,.0f} baris/s)")
+    print(f"apply(fix_date) (est.): {t_apply:.2f} s ({len(sample) / t_sample:,.0f} baris/s)")
+    print(f"speedup               : {t_apply / t_vector:.1f}x")
+    print(f"hasil identik (sampel): {expected.equals(hasil.head(len(sample)))}")
+
+    # Jalur cepat fix_date vs pd.to_datetime untuk setiap string unik messy_dates
+    unik = messy_dates(args.sampel_fix_date).dropna().unique()
+    reset_parse_stats()
+    start = time.perf_counter()
+    cepat = [_parse_fix_date(s) for s in unik]
+    t_cepat = time.perf_counter() - start
+    stats = parse_stats()
+    start = time.perf_counter()
+    lambat = [_fix_date_pandas(_clean_fix_date(s)) for s in unik]
+    t_pandas = time.perf_counter() - start
+
+    print(f"string unik (messy)   : {len(unik):,}")
+    print(f"fix_date jalur cepat  : {t_cepat:.2f} s (cepat {stats['cepat']:,}, pandas {stats['pandas']:,}, "
+          f"gagal {stats['gagal']:,})")
+    print(f"fix_date hanya pandas : {t_pandas:.2f} s")
+    print(f"speedup               : {t_pandas / t_cepat:.1f}x")
+    print(f"hasil identik         : {cepat == lambat}")
+
+    # Deteksi kolom tanggal pada ekspor 60 kolom: scalar pd.to_datetime vs profil skema
+    df = _ekspor_lebar(args.baris_deteksi)
+    start = time.perf_counter()
+    lama = _deteksi_skalar(df)
+    t_lama = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_profile.PROFILE_DIR = tmp
+        start = time.perf_counter()
+        baru = _detect_date_columns(df, "transaksi")
+        t_profil = time.perf_counter() - start
+        start = time.perf_counter()
+        tersimpan = _detect_date_columns(df, "transaksi")
+        t_hit = time.perf_counter() - start
+
+    print(f"deteksi 60 kolom      : {len(df):,} baris")
+    print(f"pd.to_datetime skalar : {t_lama * 1000:.1f} ms")
+    print(f"profil skema (baru)   : {t_profil * 1000:.1f} ms ({t_lama / t_profil:.0f}x)")
+    print(f"profil tersimpan      : {t_hit * 1000:.2f} ms")
+    print(f"kolom identik         : {lama == baru == tersimpan} {baru}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# benchmarks/generators.py
+# Generator data sintetis DQMart (seeded, tervektorisasi sehingga 10k-10M baris tetap cepat)
+import os
+
+import numpy as np
+import pandas as pd
+
+BULAN = ["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli", "Agustus", "September",
+         "Oktober", "November", "Desember", "Jan", "Feb", "Mar", "Apr", "Jun", "Jul", "Agu", "Aug",
+         "Sep", "Okt", "Oct", "Nov", "Des", "Dec", "May", "June", "August"]
+
+KALIMAT = [
+    "{nama} membayar pajak PBB pada {tanggal} di kantor pajak",
+    "{nama} berangkat kerja tanggal {tanggal}",
+    "{nama} mengikuti seminar di {tanggal} berjudul AI dan kita",
+    "{nama} mulai lembur pada {tanggal} untuk mencari tambahan uang",
+    "{nama} isi bensin tanpa catatan tanggal",
+]
+NAMA = ["Susi", "Andi", "Bagas", "Riko", "Joni", "Nina", "Rina", "Doni", "Kiki", "Mira"]
+
+# Batas baris satu sheet xlsx (di luar header)
+XLSX_MAX_ROWS = 1_048_575
+
+
+def synthetic_transactions(n_transaksi: int, n_produk: int, seed: int = 0) -> pd.DataFrame:
+    # Popularitas produk mengikuti distribusi Zipf, 1-6 produk per transaksi
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(1, 7, size=n_transaksi)
+    kode = np.repeat(np.arange(n_transaksi), sizes)
+    weights = 1.0 / np.arange(1, n_produk + 1)
+    produk = rng.choice(n_produk, size=len(kode), p=weights / weights.sum())
+    return pd.DataFrame({
+        "Kode Transaksi": kode,
+        "Nama Produk": pd.Categorical.from_codes(produk, [f"Produk {i:05d}" for i in range(n_produk)]),
+    })
+
+
+def synthetic_dates(n: int, seed: int = 0) -> pd.Series:
+    # Campuran bentuk yang ada di file DQMart: "17 Desember 2024", "25 Juni '24", "2024, 6 Nov"
+    rng = np.random.default_rng(seed)
+    day = rng.integers(1, 29, size=n).astype(str)
+    month = np.asarray(BULAN, dtype=object)[rng.integers(0, len(BULAN), size=n)]
+    year = rng.integers(2020, 2026, size=n)
+    bentuk = rng.integers(0, 3, size=n)
+    dmy = pd.Series(day + " " + month + " " + year.astype(str))
+    dmyy = pd.Series(day + " " + month + " '" + (year % 100).astype(str))
+    ydm = pd.Series(year.astype(str) + ", " + day + " " + month)
+    return dmy.where(bentuk == 0, dmyy.where(bentuk == 1, ydm))
+
+
+def messy_dates(n: int, seed: int = 0) -> pd.Series:
+    # synthetic_dates ditambah bentuk lain yang ditangani fix_date/parse_date: ISO,
+    # dd-mm-YYYY, "2024 6 November", kutip miring, huruf besar, titik, spasi ganda,
+    # serta sebagian kecil tanggal tidak valid/teks bebas (jalur fallback)
+    rng = np.random.default_rng(seed + 1)
+    hasil = synthetic_dates(n, seed).to_numpy(dtype=object)
+    day = rng.integers(1, 29, size=n)
+    month = rng.integers(1, 13, size=n)
+    year = rng.integers(2020, 2026, size=n)
+    d2, m2, y = np.char.zfill(day.astype(str), 2), np.char.zfill(month.astype(str), 2), year.astype(str)
+    nama = np.asarray(BULAN[:12], dtype=object)[month - 1]
+
+    bentuk = rng.choice(8, size=n, p=[0.55, 0.1, 0.1, 0.07, 0.07, 0.06, 0.04, 0.01])
+    lain = {
+        1: y.astype(object) + "-" + m2 + "-" + d2,
+        2: d2.astype(object) + "-" + m2 + "-" + y,
+        3: y.astype(object) + " " + day.astype(str) + " " + nama,
+        4: pd.Series(hasil).str.replace("'", "‘", regex=False).to_numpy(dtype=object),
+        5: pd.Series(hasil).str.upper().to_numpy(dtype=object),
+        6: (pd.Series(hasil).str.replace(" ", "  ", regex=False) + ".").to_numpy(dtype=object),
+        7: np.asarray(["31 Februari 2024", "kemarin sore", "2024/13/45", ""], dtype=object)[rng.integers(0, 4, size=n)],
+    }
+    for k, values in lain.items():
+        hasil = np.where(bentuk == k, values, hasil)
+    return pd.Series(hasil, dtype=object)
+
+
+def synthetic_keterangan(n: int, seed: int = 0) -> pd.Series:
+    # Teks bebas berisi tanggal DQMart di posisi acak, nama dan nomor berbeda tiap baris
+    rng = np.random.default_rng(seed)
+    tanggal = synthetic_dates(n, seed)
+    kalimat = rng.integers(0, len(KALIMAT), size=n)
+    nama = rng.integers(0, len(NAMA), size=n)
+
+    # Template dipecah di {tanggal} lalu disambung per kolom (tanpa loop per baris)
+    parts = [t.replace("{nama}", "").split("{tanggal}") for t in KALIMAT]
+    pre = np.asarray([p[0] for p in parts], dtype=object)[kalimat]
+    post = np.asarray([p[1] if len(p) > 1 else "" for p in parts], dtype=object)[kalimat]
+    ada = np.asarray([len(p) > 1 for p in parts])[kalimat]
+    teks = (pd.Series(np.asarray(NAMA, dtype=object)[nama]) + pre + tanggal.where(ada, "") + post
+            + " #" + pd.Series(np.arange(n)).astype(str))
+    return teks
+
+
+def _produk(rng, n: int, n_produk: int):
+    weights = 1.0 / np.arange(1, n_produk + 1)
+    return rng.choice(n_produk, size=n, p=weights / weights.sum())
+
+
+def _transaksi_rows(n_rows: int, n_produk: int, rng):
+    # Id transaksi (2-5 baris per transaksi) dan id produk (Zipf) untuk tepat n_rows baris
+    sizes = rng.integers(2, 6, size=n_rows // 2 + 1)
+    kode = np.repeat(np.arange(len(sizes)), sizes)[:n_rows]
+    return kode, _produk(rng, n_rows, n_produk)
+
+
+def _detail_penjualan(kode, produk, rng) -> dict:
+    qty = rng.integers(1, 10, size=len(kode))
+    harga = (produk % 40 + 1) * 2500
+    diskon = np.where(rng.random(len(kode)) < 0.1, 5000, 0)
+    return {
+        "Kode Produk": np.char.add("P", np.char.zfill(produk.astype(str), 4)),
+        "Nama Produk": np.char.add("Produk ", np.char.zfill(produk.astype(str), 5)),
+        "Qty": qty,
+        "Harga": harga,
+        "Diskon": diskon,
+        "Total Harga": qty * harga - diskon,
+    }
+
+
+def penjualan_frame(n_rows: int, n_produk: int = 500, seed: int = 0) -> pd.DataFrame:
+    # Input normalize_tanggal_transaksi: kolom seperti penjualan_dqmart_01-beta.xlsx,
+    # satu tanggal berantakan per transaksi
+    rng = np.random.default_rng(seed)
+    kode, produk = _transaksi_rows(n_rows, n_produk, rng)
+    tanggal = messy_dates(int(kode[-1]) + 1 if n_rows else 0, seed).to_numpy()[kode]
+    return pd.DataFrame({"Kode Transaksi": kode + 1, "Tanggal Transaksi": tanggal,
+                         **_detail_penjualan(kode, produk, rng)})
+
+
+def transaksi_raw_frame(n_rows: int, n_produk: int = 500, seed: int = 0) -> pd.DataFrame:
+    # Input process_excel: kolom seperti transaksi-raw-partial.xlsx (Keterangan bebas)
+    rng = np.random.default_rng(seed)
+    kode, produk = _transaksi_rows(n_rows, n_produk, rng)
+    keterangan = synthetic_keterangan(int(kode[-1]) + 1 if n_rows else 0, seed).to_numpy()[kode]
+    return pd.DataFrame({"Kode Transaksi": kode + 1, "Keterangan": keterangan,
+                         **_detail_penjualan(kode, produk, rng)})
+
+
+def basket_frame(n_rows: int, n_produk: int = 500, seed: int = 0, n_paket: int = 20, rate: float = 0.3) -> pd.DataFrame:
+    # Input run_analysis: kolom seperti transaksi_dqmart.xlsx (sheet Transaksi).
+    # Sebagian transaksi (`rate`) berisi salah satu dari `n_paket` paket 2-3 produk
+    # yang sering dibeli bersama, sehingga ada rule yang lolos min_threshold
+    rng = np.random.default_rng(seed)
+    kode, produk = _transaksi_rows(n_rows, n_produk, rng)
+    n_transaksi = int(kode[-1]) + 1 if n_rows else 0
+    paket = rng.integers(0, n_produk, size=(n_paket, 3))
+    panjang = rng.integers(2, 4, size=n_paket)
+    pilih = np.where(rng.random(n_transaksi) < rate, rng.integers(0, n_paket, size=n_transaksi), -1)[kode]
+    posisi = np.arange(n_rows) - np.searchsorted(kode, kode)  # urutan baris dalam transaksi
+    ganti = (pilih >= 0) & (posisi < panjang[np.maximum(pilih, 0)])
+    produk = np.where(ganti, paket[np.maximum(pilih, 0), np.minimum(posisi, 2)], produk)
+    return pd.DataFrame({
+        "Kode Transaksi": np.char.add("Invoice ", (kode + 1).astype(str)),
+        "Nama Produk": np.char.add("Produk ", np.char.zfill(produk.astype(str), 5)),
+        "Jumlah": rng.integers(1, 5, size=n_rows),
+    })
+
+
+def packaging_frame(n_sets: int, n_produk: int = 2000, seed: int = 0) -> pd.DataFrame:
+    # Tabel Packaging sintetis (output run_analysis): 2-4 produk per set, produk
+    # populer (Zipf) muncul di banyak set, terurut lift lalu confidence menurun
+    rng = np.random.default_rng(seed)
+    draws = np.sort(_produk(rng, n_sets * 4, n_produk).reshape(n_sets, 4), axis=1)
+    sizes = rng.integers(2, 5, size=n_sets)
+    names = np.char.add("Produk ", np.char.zfill(np.arange(n_produk).astype(str), 5)).astype(object)
+    products = [";".join(names[np.unique(row[:k])]) for row, k in zip(draws, sizes)]
+    lift = np.sort(rng.gamma(2.0, 1.5, size=n_sets) + 1)[::-1]
+    return pd.DataFrame({
+        "Packaging Set ID": np.arange(1, n_sets + 1),
+        "Products": products,
+        "Maximum_Lift": lift,
+        "Maximum_Confidence": rng.uniform(0.4, 1.0, size=n_sets),
+    })
+
+
+def write_input(df: pd.DataFrame, path: str, sheet_name: str) -> str:
+    # Simpan sebagai csv atau xlsx sesuai ekstensi (xlsx dibatasi ukuran sheet)
+    if os.path.splitext(path)[1].lower() == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        if len(df) > XLSX_MAX_ROWS:
+            raise ValueError(f"{len(df):,} baris melebihi batas satu sheet xlsx, gunakan csv.")
+        from output import write_table
+        write_table(df, path, sheet_name=sheet_name)
+    return path
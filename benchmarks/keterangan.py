@@ -0,0 +1,56 @@
+# benchmarks/keterangan.py
+# Jalankan dari root repo: python -m benchmarks.keterangan --baris 1000000
+import argparse
+import re
+import time
+
+from benchmarks.generators import synthetic_keterangan
+from parse_and_map import _extract_date, extract_dates, month_dict
+
+
+def _per_baris_lama(keterangan):
+    # Jalur lama: pola regex sebagai string dan month_dict dibangun ulang untuk setiap baris
+    match = re.search(r'(\d{4}),?\s*(\d{1,2})\s*([A-Za-z]+|[A-Za-z]{3})'
+                      r'|(\d{1,2})\s([A-Za-z]+|[A-Za-z]{3})\s(\d{2,4}|\'\d{2})', keterangan)
+    if match:
+        if match.group(1):
+            year, day, month_name = match.group(1), match.group(2), match.group(3)
+        else:
+            day, month_name, year = match.group(4), match.group(5), match.group(6)
+            if year.startswith("'"):
+                year = '20' + year[1:]
+        bulan = dict(month_dict)
+        if month_name in bulan:
+            return f"{day}-{bulan[month_name]:02d}-{year}"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baris", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = synthetic_keterangan(args.baris)
+
+    start = time.perf_counter()
+    lama = values.apply(_per_baris_lama)
+    t_lama = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = values.apply(_extract_date)
+    t_apply = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hasil = extract_dates(values)
+    t_vector = time.perf_counter() - start
+
+    print(f"baris          : {len(values):,}")
+    print(f"apply lama     : {t_lama:.2f} s")
+    print(f"apply per baris: {t_apply:.2f} s  (regex terkompilasi)")
+    print(f"extract_dates  : {t_vector:.2f} s")
+    print(f"speedup        : {t_lama / t_vector:.1f}x vs lama, {t_apply / t_vector:.1f}x vs apply")
+    print(f"hasil identik  : {lama.equals(hasil) and expected.equals(hasil)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# benchmarks/mining.py
+# Jalankan dari root repo: python -m benchmarks.mining --transaksi 200000
+import argparse
+import time
+
+from basket import ALGORITHMS, build_basket, frequent_itemsets
+from benchmarks.generators import synthetic_transactions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transaksi", type=int, default=200_000)
+    parser.add_argument("--produk", type=int, default=500)
+    parser.add_argument("--support", type=float, nargs="+", default=[0.05, 0.02, 0.01, 0.005, 0.002])
+    parser.add_argument("--algorithm", nargs="+", default=list(ALGORITHMS))
+    args = parser.parse_args()
+
+    df = synthetic_transactions(args.transaksi, args.produk)
+    basket = build_basket(df["Kode Transaksi"], df["Nama Produk"])
+
+    print(f"{'min_support':>11} {'itemsets':>9} " + " ".join(f"{a:>10}" for a in args.algorithm) + "  tercepat")
+    for min_support in args.support:
+        timings = {}
+        for algorithm in args.algorithm:
+            start = time.perf_counter()
+            n_itemsets = len(frequent_itemsets(basket, min_support, algorithm=algorithm))
+            timings[algorithm] = time.perf_counter() - start
+        fastest = min(timings, key=timings.get)
+        print(f"{min_support:>11} {n_itemsets:>9} " + " ".join(f"{timings[a]:>9.3f}s" for a in args.algorithm) + f"  {fastest}")
+
+
+if __name__ == "__main__":
+    main()
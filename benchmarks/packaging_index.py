@@ -0,0 +1,66 @@
+# benchmarks/packaging_index.py
+# Jalankan dari root repo: python -m benchmarks.packaging_index --sets 100000
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.generators import packaging_frame
+from packaging_index import PackagingIndex, write_index
+
+
+def _latency(func, carts) -> np.ndarray:
+    # Latensi per query dalam mikrodetik
+    hasil = np.empty(len(carts))
+    for i, cart in enumerate(carts):
+        start = time.perf_counter()
+        func(cart)
+        hasil[i] = (time.perf_counter() - start) * 1e6
+    return hasil
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sets", type=int, default=100_000)
+    parser.add_argument("--produk", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--top-n", type=int, default=10)
+    args = parser.parse_args()
+
+    packaging = packaging_frame(args.sets, args.produk)
+    members = packaging["Products"].str.split(";").map(frozenset).to_list()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        write_index(packaging, tmp)
+        t_build = time.perf_counter() - start
+        start = time.perf_counter()
+        index = PackagingIndex(tmp)
+        t_open = time.perf_counter() - start
+        print(f"set: {len(index):,}, produk: {len(index.products):,}, "
+              f"build {t_build:.2f} s, open {t_open * 1000:.1f} ms")
+
+        rng = np.random.default_rng(1)
+        for size in (1, 2, 3):
+            # Cart diambil dari isi set yang ada agar sebagian besar query punya hasil
+            carts = []
+            for i in rng.integers(0, len(members), size=args.queries):
+                items = sorted(members[i])
+                carts.append([items[j] for j in rng.permutation(len(items))[:size]])
+
+            # Hasil dicek terhadap scan penuh untuk sebagian query
+            for cart in carts[:50]:
+                expected = [r for r, m in enumerate(members) if m.issuperset(cart)][:args.top_n]
+                assert index.query_ranks(cart, args.top_n).tolist() == expected, cart
+
+            ranks = _latency(lambda c: index.query_ranks(c, args.top_n), carts)
+            full = _latency(lambda c: index.query(c, args.top_n), carts)
+            scan = _latency(lambda c: [r for r, m in enumerate(members) if m.issuperset(c)][:args.top_n], carts[:20])
+            print(f"cart {size} produk  query_ranks p50 {np.percentile(ranks, 50):7.1f} us  "
+                  f"p99 {np.percentile(ranks, 99):7.1f} us  |  query p50 {np.percentile(full, 50):7.1f} us  "
+                  f"p99 {np.percentile(full, 99):7.1f} us  |  scan p50 {np.percentile(scan, 50):9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
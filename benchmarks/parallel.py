@@ -0,0 +1,53 @@
+# benchmarks/parallel.py
+# Jalankan dari root repo: python -m benchmarks.parallel --baris 1000000
+import argparse
+import os
+import time
+from functools import partial
+
+import pandas as pd
+
+from benchmarks.generators import synthetic_dates, synthetic_keterangan
+from date_standardization import _normalize_shard
+from parallel import imap_ordered, split_rows
+from parse_and_map import _extract_shard
+
+CHUNKSIZE = 50_000
+
+
+def run(func, df, workers):
+    shards = (shard for start in range(0, len(df), CHUNKSIZE)
+              for shard in split_rows(df.iloc[start:start + CHUNKSIZE], workers))
+    return pd.concat(imap_ordered(func, shards, workers), ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baris", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    df = pd.DataFrame({
+        "Keterangan": synthetic_keterangan(args.baris),
+        "Tanggal Transaksi": synthetic_dates(args.baris, seed=1),
+    })
+    pipelines = {
+        "normalize_tanggal_transaksi": partial(_normalize_shard, date_cols=["Tanggal Transaksi"]),
+        "process_excel": _extract_shard,
+    }
+
+    print(f"baris: {len(df):,}, cpu: {os.cpu_count()}")
+    for name, func in pipelines.items():
+        baseline = expected = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            hasil = run(func, df.copy(), workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            expected = hasil if expected is None else expected
+            print(f"{name:<28} workers={workers:<3} {elapsed:7.2f} s  speedup {baseline / elapsed:4.1f}x"
+                  f"  identik={hasil.equals(expected)}")
+
+
+if __name__ == "__main__":
+    main()
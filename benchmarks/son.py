@@ -0,0 +1,45 @@
+# benchmarks/son.py
+# Jalankan dari root repo: python -m benchmarks.son --baris 2000000 --workers 1 2 4 8
+import argparse
+import os
+import time
+
+from apriori_hackathon import build_packaging
+from basket import ALGORITHMS, build_basket, frequent_itemsets
+from benchmarks.generators import basket_frame
+from son import son_itemsets
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baris", type=int, default=2_000_000)
+    parser.add_argument("--produk", type=int, default=500)
+    parser.add_argument("--support", type=float, default=0.002)
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default="apriori")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    df = basket_frame(args.baris, n_produk=args.produk)
+    basket = build_basket(df["Kode Transaksi"], df["Nama Produk"])
+    del df
+
+    start = time.perf_counter()
+    expected = frequent_itemsets(basket, args.support, algorithm=args.algorithm)
+    t_serial = time.perf_counter() - start
+    packaging = build_packaging(expected)
+
+    print(f"transaksi: {basket.n_transaksi:,}, produk: {len(basket.products):,}, itemset: {len(expected):,}, "
+          f"cpu: {os.cpu_count()}")
+    print(f"serial      {t_serial:7.2f} s")
+    for workers in args.workers:
+        start = time.perf_counter()
+        hasil = son_itemsets(basket, args.support, workers=workers, algorithm=args.algorithm)
+        elapsed = time.perf_counter() - start
+        hasil_packaging = build_packaging(hasil)
+        identik = (packaging is None and hasil_packaging is None) or (
+            packaging is not None and hasil_packaging is not None and packaging.equals(hasil_packaging))
+        print(f"son w={workers:<3}   {elapsed:7.2f} s  speedup {t_serial / elapsed:4.1f}x  packaging identik={identik}")
+
+
+if __name__ == "__main__":
+    main()
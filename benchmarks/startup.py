@@ -0,0 +1,79 @@
+# benchmarks/startup.py
+# Jalankan dari root repo: python -m benchmarks.startup --repeat 5 --json startup.json
+# Waktu start-up proses baru per entry point, diukur dengan `python -X importtime`
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# Nama kasus -> argumen interpreter
+CASES = {
+    "cli --help": ["cli.py", "--help"],
+    "cli packaging --help": ["cli.py", "packaging", "--help"],
+    "extract_date_from_keterangan": ["-c", "from parse_and_map import extract_date_from_keterangan"],
+    "import date_standardization": ["-c", "import date_standardization"],
+    "import apriori_hackathon": ["-c", "import apriori_hackathon"],
+    "import pandas (acuan)": ["-c", "import pandas"],
+}
+
+
+def parse_importtime(stderr: str) -> list:
+    # Baris "import time: self [us] | cumulative | nama" -> (nama, cumulative ms, kedalaman);
+    # kedalaman dari indentasi nama, 0 = import tingkat teratas
+    hasil = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        hasil.append((name.strip(), int(cumulative) / 1000, depth))
+    return hasil
+
+
+def measure(args: list, repeat: int = 5) -> dict:
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-X", "importtime", *args], capture_output=True, text=True)
+        wall = (time.perf_counter() - start) * 1000
+        if proc.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} gagal:\n{proc.stderr[-2000:]}")
+        runs.append((wall, parse_importtime(proc.stderr)))
+
+    wall = [w for w, _ in runs]
+    modules = min(runs, key=lambda r: r[0])[1]
+    # Cumulative hanya dijumlahkan untuk tingkat teratas agar tidak terhitung dua kali
+    imports = [(name, ms) for name, ms, depth in modules if depth == 0]
+    return {
+        "wall_min_ms": round(min(wall), 1),
+        "wall_median_ms": round(statistics.median(wall), 1),
+        "import_ms": round(sum(ms for _, ms in imports), 1),
+        "pandas_loaded": any(name == "pandas" for name, _, _ in modules),
+        "top_imports": [{"module": name, "ms": round(ms, 1)}
+                        for name, ms in sorted(imports, key=lambda x: -x[1])[:5]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for name, case in CASES.items():
+        r = results[name] = measure(case, args.repeat)
+        top = ", ".join(f"{t['module']} {t['ms']:.0f}" for t in r["top_imports"][:3])
+        print(f"{name:<30} wall min {r['wall_min_ms']:7.1f} ms  import {r['import_ms']:7.1f} ms  "
+              f"pandas {'ya' if r['pandas_loaded'] else 'tidak':<5}  [{top}]")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"python": sys.version.split()[0], "repeat": args.repeat, "results": results}, f, indent=2)
+        print(f"[OK] Hasil disimpan ke: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# benchmarks/suite.py
+# Jalankan dari root repo: python -m benchmarks.suite --rows 10000 100000 1000000 --json hasil_benchmark.json
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import basket_frame, penjualan_frame, transaksi_raw_frame, write_input
+
+# Nama pipeline -> (generator input, sheet input, modul, fungsi)
+PIPELINES = {
+    "dates": (penjualan_frame, "transaksi", "date_standardization", "normalize_tanggal_transaksi"),
+    "keterangan": (transaksi_raw_frame, "transaksi", "parse_and_map", "process_excel"),
+    "packaging": (basket_frame, "Transaksi", "apriori_hackathon", "run_analysis"),
+}
+
+
+def _run_case(pipeline: str, input_path: str, output_path: str, options: dict) -> dict:
+    # Dijalankan di proses baru (spawn) agar waktu, CPU dan puncak RSS hanya milik satu run;
+    # cache sidecar dan profil skema dimatikan supaya setiap run membaca file dan
+    # mendeteksi kolom tanggal dari awal (dan tidak menulis ke ~/.cache pengguna)
+    import importlib
+    import warnings
+
+    import schema_profile
+    import sidecar
+
+    warnings.simplefilter("ignore")
+    sidecar.CACHE_DIR = ""
+    schema_profile.PROFILE_DIR = ""
+    _, _, module, func = PIPELINES[pipeline]
+    run = getattr(importlib.import_module(module), func)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start, cpu_start = time.perf_counter(), time.process_time()
+    run(input_path, output_path, **options)
+    return {
+        "wall_s": time.perf_counter() - start,
+        "cpu_s": time.process_time() - cpu_start,
+        "rss_before_mib": rss_before / 1024,
+        "peak_rss_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(rows, pipelines, repeat: int = 3, seed: int = 0, input_format: str = "csv",
+              output_format: str = "csv", workers: int = 1, min_support: float = 0.01) -> dict:
+    """Ukur setiap pipeline end-to-end (file input -> file output) pada beberapa ukuran data."""
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pipeline in pipelines:
+            generate, sheet, _, _ = PIPELINES[pipeline]
+            options = {"output_format": output_format}
+            if pipeline == "packaging":
+                options["min_support"] = min_support
+            else:
+                options["workers"] = workers
+            for n in rows:
+                input_path = write_input(generate(n, seed=seed), os.path.join(tmp, f"{pipeline}_{n}.{input_format}"), sheet)
+                output_path = os.path.join(tmp, f"{pipeline}_{n}_out.{output_format}")
+                runs = []
+                for _ in range(repeat):
+                    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                        runs.append(pool.submit(_run_case, pipeline, input_path, output_path, options).result())
+                wall = [r["wall_s"] for r in runs]
+                result = {
+                    "pipeline": pipeline, "rows": n, "repeat": repeat, "workers": options.get("workers", 1),
+                    "input_format": input_format, "output_format": output_format,
+                    "wall_s": [round(w, 4) for w in wall],
+                    "wall_min_s": round(min(wall), 4),
+                    "wall_median_s": round(statistics.median(wall), 4),
+                    "cpu_median_s": round(statistics.median(r["cpu_s"] for r in runs), 4),
+                    "peak_rss_mib": round(max(r["peak_rss_mib"] for r in runs), 1),
+                    "rss_before_mib": round(min(r["rss_before_mib"] for r in runs), 1),
+                    "rows_per_s": round(n / min(wall)),
+                }
+                results.append(result)
+                print(f"{pipeline:<11} {n:>11,} baris  min {result['wall_min_s']:8.2f} s  "
+                      f"median {result['wall_median_s']:8.2f} s  {result['rows_per_s']:>10,} baris/s  "
+                      f"RSS {result['peak_rss_mib']:8.1f} MiB", flush=True)
+                os.remove(input_path)
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": seed,
+            "min_support": min_support,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--pipelines", nargs="+", choices=list(PIPELINES), default=list(PIPELINES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--input-format", choices=["csv", "xlsx"], default="csv")
+    parser.add_argument("--output-format", choices=["csv", "parquet", "xlsx"], default="csv")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--min-support", type=float, default=0.01, help="khusus packaging")
+    parser.add_argument("--json", help="simpan hasil ke file JSON (untuk dibandingkan antar commit)")
+    args = parser.parse_args()
+
+    report = run_suite(args.rows, args.pipelines, args.repeat, args.seed, args.input_format,
+                       args.output_format, args.workers, args.min_support)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[OK] Hasil disimpan ke: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
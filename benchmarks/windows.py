@@ -0,0 +1,60 @@
+# benchmarks/windows.py
+# Jalankan dari root repo: python -m benchmarks.windows --baris 200000 --bulan 6
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from apriori_hackathon import build_packaging
+from basket import ALGORITHMS, build_basket, build_basket_sorted, frequent_itemsets
+from benchmarks.generators import basket_frame
+from windows import make_windows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baris", type=int, default=200_000)
+    parser.add_argument("--produk", type=int, default=300)
+    parser.add_argument("--bulan", type=int, default=6)
+    parser.add_argument("--support", type=float, default=0.01)
+    args = parser.parse_args()
+
+    # Satu tanggal acak per transaksi dalam `bulan` bulan pertama 2024
+    df = basket_frame(args.baris, n_produk=args.produk)
+    kode, inverse = np.unique(df["Kode Transaksi"].to_numpy(), return_inverse=True)
+    hari = np.random.default_rng(1).integers(0, args.bulan * 30, size=len(kode))
+    df["Tanggal"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(hari[inverse], unit="D")
+
+    basket, tkey = build_basket_sorted(df["Kode Transaksi"], df["Nama Produk"], df["Tanggal"])
+    windows = []
+    for label, start, end in make_windows(tkey, "M"):
+        lo, hi = np.searchsorted(tkey, [np.datetime64(start), np.datetime64(end)])
+        windows.append((label, start, end, int(lo), int(hi)))
+    print(f"transaksi: {basket.n_transaksi:,}, jendela: {len(windows)}, "
+          f"batas jendela bukan kelipatan 64: {sum(lo % 64 != 0 for *_, lo, _ in windows)}")
+
+    for algorithm in ALGORITHMS:
+        t_window = t_sendiri = 0.0
+        identik = True
+        for label, start, end, lo, hi in windows:
+            # Jendela sebagai potongan bitset vs basket yang dibangun ulang dari baris jendela saja
+            t0 = time.perf_counter()
+            hasil = build_packaging(frequent_itemsets(basket.window(lo, hi), args.support, algorithm=algorithm))
+            t1 = time.perf_counter()
+            rows = df[(df["Tanggal"] >= start) & (df["Tanggal"] < end)]
+            sendiri = build_packaging(frequent_itemsets(build_basket(rows["Kode Transaksi"], rows["Nama Produk"]),
+                                                        args.support, algorithm=algorithm))
+            t2 = time.perf_counter()
+            t_window += t1 - t0
+            t_sendiri += t2 - t1
+            if not ((hasil is None and sendiri is None) or (hasil is not None and sendiri is not None
+                                                             and hasil.equals(sendiri))):
+                identik = False
+                print(f"  {algorithm} {label}: berbeda dari mining jendela sendiri")
+        print(f"{algorithm:<9} Basket.window {t_window:6.2f} s  |  basket per jendela {t_sendiri:6.2f} s  "
+              f"|  packaging identik={identik}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/worker.py
+# Jalankan dari root repo: python -m benchmarks.worker --clients 8 --requests 200 --values 20
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.generators import messy_dates, synthetic_keterangan
+from worker import WorkerClient
+
+# Satu panggilan "dingin": proses baru, import pandas dan tabel format dari awal
+COLD = ("import json, sys, pandas as pd; from date_standardization import normalize_dates; "
+        "print(json.dumps(normalize_dates(pd.Series(json.load(sys.stdin), dtype=object)).tolist()))")
+
+
+def start_worker_process(max_wait_ms: float):
+    proc = subprocess.Popen([sys.executable, "-W", "ignore", "worker.py", "--port", "0",
+                             "--max-wait-ms", str(max_wait_ms)], stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline()  # "[OK] Worker siap di http://127.0.0.1:PORT"
+    return proc, line.split()[-1]
+
+
+def run_clients(url: str, endpoint: str, pool: list, clients: int, requests: int, values: int) -> dict:
+    latency, lock = [], threading.Lock()
+
+    def client(seed):
+        rng = np.random.default_rng(seed)
+        conn = WorkerClient(url)
+        call = conn.dates if endpoint == "dates" else conn.keterangan
+        own = []
+        for _ in range(requests):
+            batch = [pool[i] for i in rng.integers(0, len(pool), size=values)]
+            start = time.perf_counter()
+            call(batch)
+            own.append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            latency.extend(own)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    latency = np.asarray(latency) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(latency, 50)), 3),
+        "p99_ms": round(float(np.percentile(latency, 99)), 3),
+        "requests_per_s": round(len(latency) / elapsed, 1),
+        "rows_per_s": round(len(latency) * values / elapsed, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200, help="request per klien")
+    parser.add_argument("--values", type=int, default=20, help="nilai per request")
+    parser.add_argument("--max-wait-ms", type=float, nargs="+", default=[0.0, 2.0])
+    parser.add_argument("--cold-runs", type=int, default=3)
+    parser.add_argument("--json", help="simpan hasil ke file JSON")
+    args = parser.parse_args()
+
+    pools = {"dates": messy_dates(50_000).tolist(), "keterangan": synthetic_keterangan(50_000).tolist()}
+    report = {"clients": args.clients, "requests": args.requests, "values": args.values, "warm": {}}
+
+    # Acuan: satu proses baru per panggilan
+    cold = []
+    for _ in range(args.cold_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-W", "ignore", "-c", COLD], input=json.dumps(pools["dates"][:args.values]),
+                       capture_output=True, text=True, check=True)
+        cold.append((time.perf_counter() - start) * 1000)
+    report["cold_dates_ms"] = round(float(np.median(cold)), 1)
+    print(f"dingin (proses baru per panggilan)  dates median {report['cold_dates_ms']:8.1f} ms")
+
+    for max_wait in args.max_wait_ms:
+        proc, url = start_worker_process(max_wait)
+        try:
+            for endpoint, pool in pools.items():
+                r = run_clients(url, endpoint, pool, args.clients, args.requests, args.values)
+                batches = WorkerClient(url).stats()["batches"][endpoint]
+                r["requests_per_batch"] = batches["requests_per_batch"]
+                report["warm"][f"{endpoint} max_wait={max_wait}ms"] = r
+                print(f"hangat max_wait={max_wait:<4} {endpoint:<10}  p50 {r['p50_ms']:7.2f} ms  p99 {r['p99_ms']:7.2f} ms  "
+                      f"{r['requests_per_s']:8.1f} req/s  {r['rows_per_s']:10.1f} baris/s  "
+                      f"{r['requests_per_batch']} req/batch")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[OK] Hasil disimpan ke: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
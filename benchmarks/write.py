@@ -0,0 +1,80 @@
+# benchmarks/write.py
+# Jalankan dari root repo: python -m benchmarks.write --baris 200000
+import argparse
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generators import synthetic_dates
+from output import write_table
+
+
+def synthetic_chunks(n: int, chunksize: int = 50_000, seed: int = 0):
+    # Potongan berbentuk output normalize_tanggal_transaksi (dtype=str, 8 kolom)
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunksize):
+        m = min(chunksize, n - start)
+        qty = rng.integers(1, 10, size=m)
+        harga = rng.integers(1, 200, size=m) * 500
+        yield pd.DataFrame({
+            "Kode Transaksi": (np.arange(start, start + m) // 3 + 100_000).astype(str),
+            "Tanggal Transaksi": synthetic_dates(m, seed + start).to_numpy(),
+            "Kode Produk": np.char.add("P", rng.integers(0, 500, size=m).astype(str)),
+            "Nama Produk": np.char.add("Produk ", rng.integers(0, 500, size=m).astype(str)),
+            "Qty": qty.astype(str),
+            "Harga": harga.astype(str),
+            "Diskon": np.zeros(m, dtype=int).astype(str),
+            "Total Harga": (qty * harga).astype(str),
+        }, dtype=object)
+
+
+def _to_excel(chunks, path):
+    # Jalur lama: gabungkan semua potongan lalu DataFrame.to_excel
+    df = pd.concat(list(chunks), ignore_index=True)
+    df.to_excel(path, index=False, sheet_name="transaksi")
+
+
+def _write_xlsx(chunks, path):
+    write_table(chunks, path, sheet_name="transaksi")
+
+
+def _run_case(func, n, chunksize, path):
+    # Dijalankan di proses baru agar puncak RSS (ru_maxrss, KiB) hanya milik kasus ini
+    start = time.perf_counter()
+    func(synthetic_chunks(n, chunksize), path)
+    seconds = time.perf_counter() - start
+    return seconds, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024, os.path.getsize(path)
+
+
+def _measure(func, n, chunksize, path):
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_run_case, func, n, chunksize, path).result()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baris", type=int, default=200_000)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("to_excel (lama)", "lama.xlsx", _to_excel),
+        ("xlsx write-only", "baru.xlsx", _write_xlsx),
+        ("csv", "baru.csv", write_table),
+        ("parquet", "baru.parquet", write_table),
+    ]
+    print(f"baris: {args.baris:,}, chunksize: {args.chunksize:,}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, name, func in cases:
+            seconds, peak, size = _measure(func, args.baris, args.chunksize, os.path.join(tmp, name))
+            print(f"{label:<16}: {seconds:7.2f} s ({args.baris / seconds:>9,.0f} baris/s), "
+                  f"puncak RSS {peak / 2**20:7.1f} MiB, file {size / 2**20:6.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# cli.py
+# Contoh:
+#   python cli.py dates penjualan_dqmart_01-beta.xlsx --workers 4
+#   python cli.py keterangan transaksi-raw-partial.xlsx transaksi-output.xlsx
+#   python cli.py packaging transaksi_dqmart.xlsx --min-support 0.05 --top-k 20 --format csv --profile
+#   python cli.py serve --port 8765
+# Hanya modul standar yang di-import di sini; modul pipeline (pandas, numpy, mlxtend)
+# baru dimuat setelah subcommand dipilih, jadi --help dan argumen salah tetap cepat
+import argparse
+import importlib
+import os
+
+from batch import PIPELINES, output_path_for
+
+# Argumen CLI yang bukan parameter fungsi pipeline
+_CLI_ONLY = ("pipeline", "input", "output", "profile", "profile_hook", "profile_json")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Pipeline DQMart: standardisasi tanggal, "
+                                                 "tanggal dari Keterangan dan analisis packaging.")
+    sub = parser.add_subparsers(dest="pipeline", required=True)
+
+    def add(name: str, help: str) -> argparse.ArgumentParser:
+        p = sub.add_parser(name, help=help)
+        p.add_argument("input", help="file xlsx/csv input")
+        p.add_argument("output", nargs="?", help=f"default: <input>{PIPELINES[name][2]}.<format> di folder input")
+        p.add_argument("--format", dest="output_format", choices=["xlsx", "csv", "parquet"], help="format file output")
+        p.add_argument("--profile", action="store_true", help="tampilkan waktu, CPU, RSS dan baris per tahap")
+        p.add_argument("--profile-hook", choices=["cprofile", "tracemalloc"], help="hook profiler tambahan")
+        p.add_argument("--profile-json", help="simpan laporan profil ke file JSON")
+        return p
+
+    p = add("dates", "standardisasi kolom tanggal (normalize_tanggal_transaksi)")
+    p.add_argument("--workers", type=int)
+    p.add_argument("--no-schema-cache", dest="schema_cache", action="store_false", default=None,
+                   help="deteksi ulang kolom tanggal, jangan pakai/simpan profil skema (schema_profile.py)")
+
+    p = add("keterangan", "ekstraksi Tanggal Transaksi dari Keterangan (process_excel)")
+    p.add_argument("--sheet", dest="sheet_name")
+    p.add_argument("--workers", type=int)
+
+    p = add("packaging", "analisis packaging produk (run_analysis)")
+    p.add_argument("--min-support", type=float)
+    p.add_argument("--algorithm", choices=["apriori", "fpgrowth", "eclat"])
+    p.add_argument("--top-k", type=int, help="hanya K set teratas")
+    p.add_argument("--sample-epsilon", type=float, help="mode sampel dengan toleransi error ini")
+    p.add_argument("--sample-delta", type=float)
+    p.add_argument("--verify-sample", action="store_true", default=None, help="hitung ulang hasil sampel secara exact")
+    p.add_argument("--workers", type=int, help="mining paralel per partisi transaksi (SON)")
+    p.add_argument("--index", dest="index_path", help="direktori index produk -> set packaging (packaging_index.py)")
+
+    p = sub.add_parser("serve", help="worker lokal yang tetap hangat untuk dates/keterangan (worker.py)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--max-wait-ms", type=float, default=2.0)
+    p.add_argument("--max-rows", type=int, default=50_000)
+    return parser
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.pipeline == "serve":
+        from worker import serve
+        serve(args.host, args.port, args.max_wait_ms, args.max_rows)
+        return
+
+    output = args.output or output_path_for(args.input, args.pipeline, os.path.dirname(args.input), args.output_format)
+    options = {k: v for k, v in vars(args).items() if k not in _CLI_ONLY and v is not None}
+
+    prof = None
+    if args.profile or args.profile_hook or args.profile_json:
+        from profiling import StageProfiler
+        prof = options["profile"] = StageProfiler(hook=args.profile_hook)
+
+    module, func, _ = PIPELINES[args.pipeline]
+    getattr(importlib.import_module(module), func)(args.input, output, **options)
+
+    if prof is not None:
+        prof.print_log()
+        if args.profile_json:
+            prof.save(args.profile_json)
+            print(f"[OK] Profil disimpan ke: {args.profile_json}")
+
+
+if __name__ == "__main__":
+    main()
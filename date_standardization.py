@@ -1,70 +1,393 @@
+import itertools
+import re
+from datetime import datetime
+from functools import partial
+
+import numpy as np
 import pandas as pd
 
-def normalize_tanggal_transaksi(input_xlsx_path: str, output_xlsx_path: str) -> None:
-    # Baca file Excel
-    df = pd.read_excel(input_xlsx_path, sheet_name='transaksi', dtype=str)
-
-    # Pemetaan bulan Indonesia dan Inggris
-    bulan = {
-        'januari': 'January', 'jan': 'January',
-        'februari': 'February', 'feb': 'February',
-        'maret': 'March', 'mar': 'March',
-        'april': 'April', 'apr': 'April',
-        'mei': 'May', 'may': 'May',
-        'juni': 'June', 'jun': 'June',
-        'juli': 'July', 'jul': 'July',
-        'agustus': 'August', 'agu': 'August', 'aug': 'August',
-        'september': 'September', 'sep': 'September',
-        'oktober': 'October', 'okt': 'October', 'oct': 'October',
-        'november': 'November', 'nov': 'November',
-        'desember': 'December', 'des': 'December', 'dec': 'December'
-    }
-
-    def fix_date(x):
-        if pd.isna(x):
-            return x
-
-        s = str(x).strip()
-        # Bersihkan tanda baca dan kutipan
-        for ch in [",", ".", "'", "‘", "’", "–", "-", "/", "\\"]:
-            s = s.replace(ch, " ")
-        s = " ".join(s.split())
-
-        # Ubah nama bulan ke Inggris
-        s = " ".join([bulan.get(w.lower(), w) for w in s.split()])
-
-        # Tangani format "YYYY DD MMM" atau "YYYY, DD MMM"
-        parts = s.split()
-        if len(parts) == 3 and parts[0].isdigit() and len(parts[0]) == 4:
-            y, d, m = parts
-            s = f"{d} {m} {y}"
-
-        # Tangani format tahun dua digit misal '24
-        s = s.replace("‘", "").replace("’", "").strip()
-        s = s.replace("'", "")
-
-        # Coba parsing berbagai kemungkinan format
-        for dayfirst in (True, False):
-            dt = pd.to_datetime(s, errors='coerce', dayfirst=dayfirst, infer_datetime_format=True)
-            if pd.notna(dt):
-                return dt.strftime("%d-%m-%Y")
-
-        # Jika gagal, coba paksa perbaikan dengan urutan lain
-        try:
-            dt = pd.to_datetime(s, format="%Y %m %d", errors='coerce')
-            if pd.notna(dt):
-                return dt.strftime("%d-%m-%Y")
-        except Exception:
-            pass
-
-        # Jika tetap gagal, kembalikan nilai asli agar tidak hilang
+import schema_profile
+from ingest import read_chunks
+from output import write_table
+from parallel import imap_ordered, split_rows
+from parse_cache import get_cache, normalize_key
+from profiling import NO_PROFILE
+
+# Pemetaan bulan Indonesia dan Inggris
+bulan = {
+    'januari': 'January', 'jan': 'January',
+    'februari': 'February', 'feb': 'February',
+    'maret': 'March', 'mar': 'March',
+    'april': 'April', 'apr': 'April',
+    'mei': 'May', 'may': 'May',
+    'juni': 'June', 'jun': 'June',
+    'juli': 'July', 'jul': 'July',
+    'agustus': 'August', 'agu': 'August', 'aug': 'August',
+    'september': 'September', 'sep': 'September',
+    'oktober': 'October', 'okt': 'October', 'oct': 'October',
+    'november': 'November', 'nov': 'November',
+    'desember': 'December', 'des': 'December', 'dec': 'December'
+}
+
+
+def fix_date(x):
+    if pd.isna(x):
         return x
 
-    # Cari kolom yang mengandung tanggal
-    for col in df.columns:
-        sample = df[col].dropna().astype(str).head(20)
-        if sample.apply(lambda x: pd.to_datetime(x, errors='coerce')).notna().sum() >= 3:
-            df[col] = df[col].apply(fix_date)
+    # String mentah yang sama cukup di-parse sekali (lihat parse_cache)
+    hasil = get_cache("fix_date").lookup(normalize_key(x), _parse_fix_date)
+
+    # Jika gagal, kembalikan nilai asli agar tidak hilang
+    return x if hasil is None else hasil
+
+
+def _parse_fix_date(s):
+    s = _clean_fix_date(s)
+
+    # Bentuk DQMart yang umum diselesaikan tanpa pandas (lihat _fast_fix_date)
+    hasil = _fast_fix_date(s)
+    if hasil is not None:
+        _STATS["cepat"] += 1
+        return hasil
+
+    hasil = _fix_date_pandas(s)
+    _STATS["pandas" if hasil is not None else "gagal"] += 1
+    return hasil
+
+
+def _clean_fix_date(s):
+    # Bersihkan tanda baca dan kutipan
+    for ch in [",", ".", "'", "‘", "’", "–", "-", "/", "\\"]:
+        s = s.replace(ch, " ")
+    s = " ".join(s.split())
+
+    # Ubah nama bulan ke Inggris
+    s = " ".join([bulan.get(w.lower(), w) for w in s.split()])
+
+    # Tangani format "YYYY DD MMM" atau "YYYY, DD MMM"
+    parts = s.split()
+    if len(parts) == 3 and parts[0].isdigit() and len(parts[0]) == 4:
+        y, d, m = parts
+        s = f"{d} {m} {y}"
+
+    # Tangani format tahun dua digit misal '24
+    s = s.replace("‘", "").replace("’", "").strip()
+    return s.replace("'", "")
+
+
+def _fix_date_pandas(s):
+    # Coba parsing berbagai kemungkinan format
+    for dayfirst in (True, False):
+        dt = pd.to_datetime(s, errors='coerce', dayfirst=dayfirst, infer_datetime_format=True)
+        if pd.notna(dt):
+            return dt.strftime("%d-%m-%Y")
+
+    # Jika gagal, coba paksa perbaikan dengan urutan lain
+    try:
+        dt = pd.to_datetime(s, format="%Y %m %d", errors='coerce')
+        if pd.notna(dt):
+            return dt.strftime("%d-%m-%Y")
+    except Exception:
+        pass
+
+    return None
+
+
+# Bentuk yang ditangani jalur cepat, setelah _clean_fix_date: "D Bulan YYYY", "D Bulan YY"
+# (dari 'YY) dan "D M YYYY" angka (dari dd-mm-YYYY, atau YYYY-mm-dd yang sudah ditukar)
+_BENTUK_CEPAT = re.compile(r"([0-9]{1,2}) (?:([A-Za-z]+) ([0-9]{4}|[0-9]{2})|([0-9]{1,2}) ([0-9]{4}))")
+
+# Jumlah string per jalur parsing (lihat parse_stats)
+_STATS = dict.fromkeys(("vektor", "cepat", "pandas", "gagal"), 0)
+
+
+def _fast_fix_date(s):
+    """Hari, bulan dan tahun dibaca sebagai int lalu langsung diformat dd-mm-YYYY.
+
+    None jika bentuknya lain atau hasil pd.to_datetime(dayfirst=True) tidak
+    pasti sama: bulan yang tidak dikenal, bulan angka > 12 (pandas menukar
+    hari/bulan), tanggal tidak valid, atau tahun di luar rentang Timestamp."""
+    match = _BENTUK_CEPAT.fullmatch(s)
+    if match is None:
+        return None
+    day, nama, tahun, angka, tahun_angka = match.groups()
+    if nama is not None:
+        month = ANGKA_BULAN.get(nama.lower())
+        year = int(tahun) if len(tahun) == 4 else _tahun_penuh(int(tahun))
+    else:
+        month, year = int(angka), int(tahun_angka)
+    day = int(day)
+    if month is None or not 1 <= month <= 12 or not 1678 <= year <= 2261:
+        return None
+    try:
+        datetime(year, month, day)
+    except ValueError:
+        return None
+    return f"{day:02d}-{month:02d}-{year:04d}"
+
+
+def _tahun_penuh(yy: int) -> int:
+    # Versi skalar dari _tahun_dua_digit
+    now = datetime.now().year
+    year = yy + now // 100 * 100
+    if year >= now + 50:
+        return year - 100
+    if year < now - 50:
+        return year + 100
+    return year
+
+
+def parse_stats() -> dict:
+    """Jumlah string per jalur sejak reset_parse_stats(), beserta proporsinya.
+
+    "vektor": nilai unik yang selesai di normalize_dates; "cepat": jalur cepat
+    fix_date; "pandas": fallback pd.to_datetime; "gagal": tidak terbaca.
+    fix_date dihitung per string yang benar-benar di-parse (bukan hit parse_cache)."""
+    total = sum(_STATS.values())
+    return {**_STATS, "rates": {k: v / total for k, v in _STATS.items()} if total else {}}
+
+
+def reset_parse_stats() -> None:
+    for k in _STATS:
+        _STATS[k] = 0
+
+
+# Nomor bulan untuk setiap token bulan yang dikenali fix_date: kunci `bulan`
+# ditambah nama/singkatan Inggris yang langsung dipahami pd.to_datetime
+_NAMA_BULAN = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December']
+ANGKA_BULAN = {k: _NAMA_BULAN.index(v) + 1 for k, v in bulan.items()}
+for _i, _nama in enumerate(_NAMA_BULAN, 1):
+    ANGKA_BULAN.setdefault(_nama.lower(), _i)
+    ANGKA_BULAN.setdefault(_nama[:3].lower(), _i)
+ANGKA_BULAN['sept'] = 9
+
+_TANDA_BACA = re.compile(r"[,.'‘’–\-/\\\s]+")
+_BENTUK_TANGGAL = re.compile(
+    r"^(?:(?P<ydm_y>[0-9]{4}) (?P<ydm_d>[0-9]{1,2}) (?P<ydm_m>[A-Za-z]+)"
+    r"|(?P<dmy_d>[0-9]{1,2}) (?P<dmy_m>[A-Za-z]+) (?P<dmy_y>[0-9]{4})"
+    r"|(?P<dmyy_d>[0-9]{1,2}) (?P<dmyy_m>[A-Za-z]+) (?P<dmyy_y>[0-9]{2}))$"
+)
+
+
+def _tahun_dua_digit(yy: pd.Series) -> pd.Series:
+    # Aturan abad yang sama dengan pd.to_datetime/dateutil: tahun dipilih
+    # dalam rentang 50 tahun dari tahun berjalan
+    now = datetime.now().year
+    year = yy + now // 100 * 100
+    year = year.mask(year >= now + 50, year - 100)
+    return year.mask(year < now - 50, year + 100)
+
+
+def normalize_dates(values: pd.Series) -> pd.Series:
+    """Versi vektor dari `values.apply(fix_date)` dengan hasil yang identik."""
+    values = pd.Series(values)
+
+    # Nilai unik cukup diproses sekali, hasilnya disebar kembali lewat kode factorize
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    raw = pd.Series(uniques, dtype=object)
+    hasil = raw.copy()
+    s = raw.dropna().astype(str)
+
+    # 1. Bersihkan tanda baca sekaligus rapikan spasi dalam satu regex
+    s = s.str.replace(_TANDA_BACA, " ", regex=True).str.strip()
+
+    # 2. Kelompokkan baris menurut bentuknya (Y D M, D M Y, D M 'YY)
+    parts = s.str.extract(_BENTUK_TANGGAL)
+    tanggal = pd.Series(None, index=s.index, dtype=object)
+    for bentuk in ("ydm", "dmy", "dmyy"):
+        mask = parts[f"{bentuk}_d"].notna()
+        if not mask.any():
+            continue
+        day, month, year = parts.loc[mask, [f"{bentuk}_d", f"{bentuk}_m", f"{bentuk}_y"]].T.to_numpy()
+
+        # 3. Petakan nama bulan (Indonesia/Inggris) ke angka dalam satu kali map
+        month = pd.Series(month, index=mask[mask].index).str.lower().map(ANGKA_BULAN)
+        year = pd.Series(year, index=month.index).astype(int)
+        if bentuk == "dmyy":
+            year = _tahun_dua_digit(year)
+        ok = month.notna()
+        day = pd.Series(day, index=month.index)[ok].str.zfill(2)
+        month = month[ok].astype(int).astype(str).str.zfill(2)
+        year = year[ok].astype(str).str.zfill(4)
+
+        # 4. Satu kali pd.to_datetime per bentuk, hanya untuk validasi tanggal
+        valid = pd.to_datetime(day + " " + month + " " + year, format="%d %m %Y", errors="coerce").notna()
+        tanggal[valid[valid].index] = (day + "-" + month + "-" + year)[valid]
+
+    done = tanggal.index[tanggal.notna()]
+    hasil[done] = tanggal[done]
+    _STATS["vektor"] += len(done)
+
+    # Sisanya (bentuk lain atau tanggal tidak valid) tetap memakai fix_date
+    sisa = raw.index.difference(done)
+    hasil[sisa] = raw[sisa].map(fix_date)
+    return pd.Series(hasil.to_numpy()[codes], index=values.index, name=values.name)
+
+
+# Bentuk nilai kolom tanggal untuk profil skema, setelah tanda baca diganti spasi
+# (_TANDA_BACA). Jam di belakang boleh ada, mis. "2024-12-17 00:00:00" dari sel datetime Excel.
+# Tahun saja ("2024") sengaja tidak dihitung: kolom angka seperti Harga atau Qty
+# berisi 1678-2261 akan ikut dianggap tanggal
+_BENTUK_KOLOM = re.compile(
+    r"^(?:(?P<dmy_nama>[0-9]{1,2} (?P<bulan_dmy>[A-Za-z]+) (?:[0-9]{4}|[0-9]{2}))"
+    r"|(?P<ydm_nama>[0-9]{4} [0-9]{1,2} (?P<bulan_ydm>[A-Za-z]+))"
+    r"|(?P<ymd_nama>[0-9]{4} (?P<bulan_ymd>[A-Za-z]+) [0-9]{1,2})"
+    r"|(?P<mdy_nama>(?P<bulan_mdy>[A-Za-z]+) [0-9]{1,2} [0-9]{4})"
+    r"|(?P<dmy_angka>[0-9]{1,2} [0-9]{1,2} (?:[0-9]{4}|[0-9]{2}))"
+    r"|(?P<ymd_angka>[0-9]{4} [0-9]{1,2} [0-9]{1,2})"
+    r"|(?P<ymd_rapat>(?:1[6-9]|2[0-2])[0-9]{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12][0-9]|3[01]))"
+    r"|(?P<my_nama>(?P<bulan_my>[A-Za-z]+) [0-9]{4}))"
+    r"(?: [0-9]{1,2}:[0-9]{2}(?::[0-9]{2})?)?$"
+)
+_FORMAT_KOLOM = ["dmy_nama", "ydm_nama", "ymd_nama", "mdy_nama", "dmy_angka", "ymd_angka", "ymd_rapat", "my_nama"]
+_TOKEN_BULAN = ["bulan_dmy", "bulan_ydm", "bulan_ymd", "bulan_mdy", "bulan_my"]
+
+# Kolom dianggap kolom tanggal jika minimal MIN_TANGGAL dari SAMPEL_DETEKSI nilai
+# non-kosong pertamanya berbentuk tanggal
+SAMPEL_DETEKSI = 20
+MIN_TANGGAL = 3
+_BARIS_AWAL = 1000
+
+
+def _sample_columns(df: pd.DataFrame, positions: list):
+    # SAMPEL_DETEKSI nilai non-kosong pertama per kolom, digabung jadi satu array
+    # (beserta posisi kolomnya) agar semua kolom diperiksa dengan satu kali regex
+    head = df.iloc[:_BARIS_AWAL].iloc[:, positions].to_numpy(dtype=object).T
+    notna = pd.notna(head)
+    take = notna & (notna.cumsum(axis=1) <= SAMPEL_DETEKSI)
+    values, cols = [head[take]], [np.repeat(positions, take.sum(axis=1))]
+
+    # Kolom yang jarang terisi di baris awal diambil dari seluruh potongan
+    if len(df) > _BARIS_AWAL:
+        for pos, n in zip(positions, take.sum(axis=1)):
+            if n < SAMPEL_DETEKSI:
+                extra = df.iloc[_BARIS_AWAL:, pos].dropna().head(SAMPEL_DETEKSI - n).to_numpy(dtype=object)
+                values.append(extra)
+                cols.append(np.full(len(extra), pos))
+    return np.concatenate(values), np.concatenate(cols)
+
+
+def profile_columns(df: pd.DataFrame, positions: list = None) -> dict:
+    """Klasifikasi kolom (posisi -> hasil) dengan satu uji pola vektor untuk semua kolom.
+
+    "tanggal" bernilai True/False, atau None jika sampel belum cukup untuk
+    memutuskan (kolom kosong atau hampir kosong di file ini)."""
+    positions = list(range(df.shape[1])) if positions is None else list(positions)
+    values, cols = _sample_columns(df, positions)
+    s = pd.Series(values, dtype=object).astype(str).str.replace(_TANDA_BACA, " ", regex=True).str.strip()
+    parts = s.str.extract(_BENTUK_KOLOM)
+
+    # Nama bulan harus dikenal (Indonesia/Inggris), kalau tidak bukan tanggal
+    # (token pertama yang terisi per baris; bukan bfill, yang memicu FutureWarning downcasting)
+    tok = parts[_TOKEN_BULAN].to_numpy(dtype=object)
+    tok = tok[np.arange(len(tok)), pd.notna(tok).argmax(axis=1)] if len(tok) else tok[:, 0]
+    token = pd.Series(np.where(pd.isna(tok), "", tok), dtype=object).astype(str).str.lower()
+    cocok = parts[_FORMAT_KOLOM].notna()
+    ok = cocok.any(axis=1) & ((token == "") | token.isin(ANGKA_BULAN))
+    fmt = cocok.idxmax(axis=1).where(ok)
+
+    # Jumlah sampel dan nilai berbentuk tanggal per kolom; format dan nama bulan
+    # hanya dirinci untuk kolom yang punya nilai tanggal
+    fmt, token = fmt.to_numpy(), token.to_numpy()
+    hit = ~pd.isna(fmt)
+    n_sampel = dict(zip(*np.unique(cols, return_counts=True)))
+    n_hit = dict(zip(*np.unique(cols[hit], return_counts=True)))
+    hasil = {}
+    for pos in positions:
+        n, h = int(n_sampel.get(pos, 0)), int(n_hit.get(pos, 0))
+        if h >= MIN_TANGGAL:
+            tanggal = True
+        elif n >= SAMPEL_DETEKSI:
+            tanggal = False
+        else:
+            tanggal = None
+        hasil[pos] = {"tanggal": tanggal, "sampel": n, "formats": {}, "bulan": []}
+        if h:
+            mask = hit & (cols == pos)
+            hasil[pos]["formats"] = {k: round(v, 4) for k, v in pd.Series(fmt[mask]).value_counts(normalize=True).items()}
+            hasil[pos]["bulan"] = sorted(set(token[mask]) - {""})
+    return hasil
+
+
+def _apply_profile(profile: dict, hasil: dict) -> dict:
+    # Gabungkan hasil profile_columns ke profil skema (kunci per nama kolom)
+    for pos, r in hasil.items():
+        col = profile["columns"][pos]
+        if r["tanggal"] is None:
+            continue
+        if r["tanggal"] and col not in profile["date_columns"]:
+            profile["date_columns"].append(col)
+        if r["tanggal"]:
+            profile["formats"][col] = r["formats"]
+            profile["month_vocab"][col] = r["bulan"]
+        profile["undecided"].remove(col)
+    profile["date_columns"] = [c for c in profile["columns"] if c in profile["date_columns"]]
+    return profile
+
+
+def _detect_date_columns(df: pd.DataFrame, sheet_name=None, cache: bool = True) -> list:
+    """Kolom tanggal menurut profil skema untuk header `df` (lihat schema_profile).
+
+    Profil tersimpan dipakai langsung; hanya kolom yang belum bisa diputuskan
+    (mis. kosong di file sebelumnya) yang diperiksa ulang."""
+    cache = cache and schema_profile.enabled()
+    profile = schema_profile.load(df.columns, sheet_name) if cache else None
+    if profile is None:
+        columns = [str(c) for c in df.columns]
+        profile = {
+            "version": schema_profile.PROFILE_VERSION,
+            "signature": schema_profile.header_signature(df.columns, sheet_name),
+            "sheet": None if sheet_name is None else str(sheet_name),
+            "columns": columns,
+            "date_columns": [],
+            "undecided": list(columns),
+            "formats": {},
+            "month_vocab": {},
+        }
+        profile = _apply_profile(profile, profile_columns(df))
+        if cache:
+            schema_profile.save(profile)
+    elif profile["undecided"]:
+        undecided = [i for i, c in enumerate(profile["columns"]) if c in profile["undecided"]]
+        before = len(profile["undecided"])
+        profile = _apply_profile(profile, profile_columns(df, undecided))
+        if len(profile["undecided"]) != before:
+            schema_profile.save(profile)
+
+    date_cols = set(profile["date_columns"])
+    return [col for col, name in zip(df.columns, profile["columns"]) if name in date_cols]
+
+
+def _normalize_shard(df: pd.DataFrame, date_cols: list) -> pd.DataFrame:
+    # Potongan dari split_rows adalah irisan iloc: kolom diganti lewat assign (salinan baru)
+    return df.assign(**{col: normalize_dates(df[col]) for col in date_cols})
+
+
+def normalize_tanggal_transaksi(input_xlsx_path: str, output_xlsx_path: str, workers: int = 1, output_format: str = None,
+                                profile=None, schema_cache: bool = True) -> None:
+    # `profile`: StageProfiler opsional untuk waktu/memori per tahap (lihat profiling.py).
+    # `schema_cache`: pakai/simpan profil kolom tanggal per tata letak header (schema_profile.py)
+    prof = profile or NO_PROFILE
+    with prof.run("dates"):
+        # Baca file Excel per potongan (streaming)
+        chunks = prof.iter("read", read_chunks(input_xlsx_path, sheet_name='transaksi', dtype=str))
+
+        # Kolom tanggal cukup dideteksi sekali, dari potongan pertama; file dengan
+        # header yang sudah dikenal langsung memakai profil skema tersimpan
+        with prof.stage("detect") as stage:
+            first = next(chunks, None)
+            date_cols = []
+            if first is not None:
+                date_cols = _detect_date_columns(first, 'transaksi', schema_cache)
+                chunks = itertools.chain([first], chunks)
+            stage.add_rows(rows_out=len(date_cols))
+
+        # Setiap potongan dibagi ke `workers` proses lalu disusun kembali sesuai urutan asli
+        shards = (shard for df in prof.count_in("normalize", chunks) for shard in split_rows(df, workers))
+        hasil = prof.iter("normalize", imap_ordered(partial(_normalize_shard, date_cols=date_cols), shards, workers))
 
-    # Simpan hasil ke file output dengan format sama
-    df.to_excel(output_xlsx_path, index=False, sheet_name='transaksi')
+        # Simpan hasil ke file output dengan format sama; potongan ditulis satu per satu
+        # tanpa digabung dulu (xlsx write-only, atau csv/parquet lewat output_format)
+        with prof.stage("write"):
+            write_table(prof.count_in("write", hasil), output_xlsx_path, sheet_name='transaksi', output_format=output_format)
@@ -0,0 +1,165 @@
+# incremental.py
+import argparse
+import json
+import sqlite3
+
+import pandas as pd
+
+from apriori_hackathon import build_packaging, read_transaksi, write_packaging
+from basket import build_basket_from_chunks, frequent_itemsets
+
+FULL_EVERY = 10
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS seen (kode TEXT PRIMARY KEY);
+CREATE TABLE IF NOT EXISTS itemsets (items TEXT PRIMARY KEY, count INTEGER NOT NULL);
+CREATE TEMP TABLE IF NOT EXISTS incoming (kode TEXT PRIMARY KEY);
+"""
+
+
+def _get_meta(conn, key, default=None):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else default
+
+
+def _set_meta(conn, **values):
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+        [(k, json.dumps(v)) for k, v in values.items()],
+    )
+
+
+def _kode_keys(kode) -> pd.Series:
+    # Kunci tabel seen: Kode Transaksi dibaca dengan dtype=str (lihat run_incremental)
+    # sehingga 1 tetap "1" walaupun potongan berisi kode kosong (int64 vs float64 "1.0")
+    return pd.Series(kode).astype(str)
+
+
+def _record_keys(conn, chunks, table):
+    # Potongan diteruskan apa adanya sambil mencatat Kode Transaksi-nya ke `table`,
+    # sehingga input cukup dibaca sekali dan tidak perlu ditahan di memori
+    for kode, produk in chunks:
+        conn.executemany(f"INSERT OR IGNORE INTO {table} (kode) VALUES (?)",
+                         [(k,) for k in pd.unique(_kode_keys(kode))])
+        yield kode, produk
+
+
+def _full_mine(conn, chunks, min_support, algorithm, rebuild=False):
+    # Mining ulang seluruh riwayat: hitungan support semua itemset frequent disimpan ulang
+    conn.execute("DELETE FROM incoming")
+    basket = build_basket_from_chunks(_record_keys(conn, chunks, "incoming"))
+    hilang = conn.execute("SELECT COUNT(*) FROM seen WHERE kode NOT IN (SELECT kode FROM incoming)").fetchone()[0]
+    if hilang and not rebuild:
+        # Input hanya berisi transaksi baru: mining ulang akan menghapus riwayat yang tersimpan
+        raise ValueError(f"{hilang} Kode Transaksi yang sudah tersimpan tidak ada di input; mining ulang penuh "
+                         f"akan menghapus riwayat tersebut. Gunakan file lengkap, atau rebuild=True (--rebuild) "
+                         f"untuk membangun ulang state hanya dari input ini")
+    itemsets = frequent_itemsets(basket, min_support=min_support, algorithm=algorithm)
+    conn.execute("DELETE FROM itemsets")
+    conn.execute("DELETE FROM seen")
+    conn.executemany(
+        "INSERT INTO itemsets (items, count) VALUES (?, ?)",
+        [(json.dumps(sorted(items), ensure_ascii=False), int(round(support * basket.n_transaksi)))
+         for support, items in zip(itemsets["support"], itemsets["itemsets"])],
+    )
+    conn.execute("INSERT INTO seen (kode) SELECT kode FROM incoming")
+    _set_meta(conn, n_transaksi=basket.n_transaksi, runs_since_full=0,
+              min_support=min_support, algorithm=algorithm)
+
+
+def _new_rows(chunks, seen):
+    # Transaksi yang sudah pernah dihitung dilewati seluruhnya
+    for kode, produk in chunks:
+        baru = ~_kode_keys(kode).isin(seen).to_numpy()
+        if baru.any():
+            yield kode[baru], produk[baru]
+
+
+def _update_counts(conn, delta):
+    # Tambahkan support count dari transaksi baru saja ke itemset yang tersimpan
+    basket = build_basket_from_chunks(_record_keys(conn, delta, "seen"))
+    if basket.n_transaksi == 0:
+        return 0
+    posisi = {name: i for i, name in enumerate(basket.products)}
+    updates = []
+    for items, count in conn.execute("SELECT items, count FROM itemsets"):
+        ids = [posisi.get(p) for p in json.loads(items)]
+        if None not in ids:
+            updates.append((count + basket.support_count(ids), items))
+    conn.executemany("UPDATE itemsets SET count = ? WHERE items = ?", updates)
+    return basket.n_transaksi
+
+
+def _stored_itemsets(conn, n_transaksi, min_support) -> pd.DataFrame:
+    # Support, lift dan confidence dihitung ulang dari hitungan yang tersimpan
+    rows = [
+        (count / n_transaksi, frozenset(json.loads(items)))
+        for items, count in conn.execute("SELECT items, count FROM itemsets")
+        if n_transaksi and count / n_transaksi >= min_support
+    ]
+    return pd.DataFrame(rows, columns=["support", "itemsets"])
+
+
+def run_incremental(input_xlsx_path: str, output_xlsx_path: str, state_path: str,
+                    min_support: float = 0.05, algorithm: str = "apriori",
+                    full_every: int = FULL_EVERY, full: bool = False, top_k: int = None,
+                    rebuild: bool = False) -> None:
+    """Seperti run_analysis, tetapi support count disimpan di `state_path` (SQLite)
+    sehingga run berikutnya hanya menghitung Kode Transaksi yang belum pernah dilihat.
+    Setiap `full_every` run dilakukan mining ulang penuh agar itemset yang baru
+    melewati min_support ikut tertangkap. Mining ulang penuh menolak input yang tidak
+    memuat transaksi yang sudah tersimpan, kecuali `rebuild=True`."""
+    conn = sqlite3.connect(state_path)
+    try:
+        conn.executescript(_SCHEMA)
+        chunks = read_transaksi(input_xlsx_path, dtype=str)
+
+        runs_since_full = _get_meta(conn, "runs_since_full")
+        need_full = (
+            full
+            or runs_since_full is None
+            or runs_since_full + 1 >= full_every
+            or _get_meta(conn, "min_support") != min_support
+            or _get_meta(conn, "algorithm") != algorithm
+        )
+
+        if need_full:
+            _full_mine(conn, chunks, min_support, algorithm, rebuild=rebuild)
+        else:
+            seen = {row[0] for row in conn.execute("SELECT kode FROM seen")}
+            n_baru = _update_counts(conn, _new_rows(chunks, seen))
+            _set_meta(conn, n_transaksi=_get_meta(conn, "n_transaksi") + n_baru,
+                      runs_since_full=runs_since_full + 1)
+        conn.commit()
+
+        itemsets = _stored_itemsets(conn, _get_meta(conn, "n_transaksi"), min_support)
+    finally:
+        conn.close()
+
+    write_packaging(build_packaging(itemsets, top_k=top_k), output_xlsx_path)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--state", default="packaging_state.sqlite")
+    parser.add_argument("--min-support", type=float, default=0.05)
+    parser.add_argument("--algorithm", default="apriori")
+    parser.add_argument("--full-every", type=int, default=FULL_EVERY)
+    parser.add_argument("--full", action="store_true", help="paksa mining ulang penuh")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="izinkan mining ulang penuh membuang riwayat yang tidak ada di input")
+    parser.add_argument("--top-k", type=int)
+    args = parser.parse_args()
+    try:
+        run_incremental(args.input, args.output, args.state, min_support=args.min_support,
+                        algorithm=args.algorithm, full_every=args.full_every, full=args.full,
+                        top_k=args.top_k, rebuild=args.rebuild)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# ingest.py
+import os
+
+import numpy as np
+import pandas as pd
+
+import sidecar
+
+CHUNKSIZE = 50_000
+
+
+def _normalize_header(name) -> str:
+    return str(name).strip().lower()
+
+
+def _project(header, columns):
+    # Cocokkan kolom yang diminta dengan header file (tanpa beda spasi/huruf besar)
+    if columns is None:
+        return list(range(len(header))), list(header)
+    lookup = {_normalize_header(h): i for i, h in enumerate(header) if h is not None}
+    missing = [c for c in columns if _normalize_header(c) not in lookup]
+    if missing:
+        raise ValueError(f"Kolom {missing} tidak ditemukan di file input.")
+    return [lookup[_normalize_header(c)] for c in columns], list(columns)
+
+
+def _cell(value):
+    # Samakan dengan pd.read_excel: sel kosong menjadi NaN dan angka bulat
+    # bertipe float dibaca sebagai int
+    if value is None:
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _cell_str(value):
+    # Setara dtype=str pada pd.read_excel: nilai dikonversi per sel, kosong tetap NaN
+    return np.nan if value is None else str(_cell(value))
+
+
+def _excel_header(header) -> list:
+    # Nama kolom seperti pd.read_excel: sel kosong -> "Unnamed: i", nama ganda -> "X.1", "X.2"
+    names = []
+    for i, value in enumerate(header):
+        value = _cell(value)
+        names.append(f"Unnamed: {i}" if value is np.nan else value)
+    counts = {}
+    for i, col in enumerate(names):
+        cur = counts.get(col, 0)
+        while cur > 0:
+            counts[col] = cur + 1
+            col = f"{col}.{cur}"
+            cur = counts.get(col, 0)
+        names[i] = col
+        counts[col] = cur + 1
+    return names
+
+
+def _iter_xlsx(path, sheet_name, chunksize, as_str, columns=None):
+    from openpyxl import load_workbook
+
+    # read_only=True membaca baris secara streaming tanpa memuat seluruh sheet
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        # Hanya kolom yang diminta yang dikonversi per sel
+        idx, names = _project(_excel_header(header), columns)
+        convert = _cell_str if as_str else _cell
+        dtype = object if as_str else None
+
+        buffer, n_rows = [], 0
+        for row in rows:
+            if row is None or all(v is None for v in row):
+                continue
+            buffer.append([convert(row[i] if i < len(row) else None) for i in idx])
+            n_rows += 1
+            if len(buffer) >= chunksize:
+                yield pd.DataFrame(buffer, columns=names, dtype=dtype)
+                buffer = []
+        # Sheet yang hanya berisi header tetap menghasilkan satu potongan kosong (seperti
+        # pd.read_excel dan read_csv) agar nama kolom sampai ke file output
+        if buffer or n_rows == 0:
+            yield pd.DataFrame(buffer, columns=names, dtype=dtype)
+    finally:
+        wb.close()
+
+
+def _iter_csv(path, columns, chunksize, dtype):
+    header = pd.read_csv(path, nrows=0).columns
+    idx, names = _project(header, columns)
+    for chunk in pd.read_csv(path, usecols=[header[i] for i in idx], chunksize=chunksize, dtype=dtype):
+        yield chunk[[header[i] for i in idx]].set_axis(names, axis=1)
+
+
+def read_chunks(path, sheet_name=0, columns=None, chunksize: int = CHUNKSIZE, dtype=None, cache: bool = True):
+    """Baca file transaksi (xlsx/csv) per potongan berisi maksimal `chunksize` baris.
+
+    Workbook xlsx yang sudah pernah dibaca diambil dari salinan Arrow di cache
+    (lihat sidecar) selama file sumbernya belum berubah."""
+    if os.path.splitext(str(path))[1].lower() == ".csv":
+        yield from _iter_csv(path, columns, chunksize, dtype)
+        return
+
+    # Kolom yang dipilih ikut menjadi kunci cache: salinan Arrow hanya berisi kolom itu
+    as_str = dtype is str
+    mode = "str" if as_str else "raw"
+    if columns is not None:
+        mode = f"{mode}:{','.join(map(str, columns))}"
+    chunks = sidecar.load(path, sheet_name, mode, chunksize) if cache and sidecar.enabled() else None
+    if chunks is None:
+        chunks = _iter_xlsx(path, sheet_name, chunksize, as_str, columns)
+        if cache and sidecar.enabled():
+            chunks = sidecar.store(path, sheet_name, mode, chunks)
+    yield from chunks
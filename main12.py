@@ -1,76 +1,160 @@
+import numpy as np
 import pandas as pd
+from dataclasses import dataclass, field
 from datetime import datetime
 import re
 
-def normalize_tanggal_transaksi(input_xlsx_path: str, output_xlsx_path: str) -> None:
-    # Baca file Excel
-    df = pd.read_excel(input_xlsx_path, sheet_name='transaksi')
+from parse_cache import get_cache, normalize_key
 
-    def parse_date(date_str):
-        if pd.isna(date_str):
-            return date_str
-        
-        date_str = str(date_str).strip()
-
-        # Hapus tanda kutip atau koma
-        date_str = date_str.replace("‘", "'").replace("’", "'").replace(",", " ").replace(".", " ")
-        date_str = re.sub(r"\s+", " ", date_str).strip()
-
-        # Ubah bulan bahasa Indonesia → Inggris
-        bulan_map = {
-            "januari": "January", "jan": "Jan",
-            "februari": "February", "feb": "Feb",
-            "maret": "March", "mar": "Mar",
-            "april": "April", "apr": "Apr",
-            "mei": "May",
-            "juni": "June", "jun": "Jun",
-            "juli": "July", "jul": "Jul",
-            "agustus": "August", "agu": "Aug",
-            "september": "September", "sep": "Sep",
-            "oktober": "October", "okt": "Oct",
-            "november": "November", "nov": "Nov",
-            "desember": "December", "des": "Dec"
-        }
-
-        for indo, eng in bulan_map.items():
-            pattern = re.compile(rf"\b{indo}\b", re.IGNORECASE)
-            date_str = pattern.sub(eng, date_str)
-
-        # Deteksi tahun dua digit dengan tanda kutip ('24 → 2024)
-        if re.search(r"'\d{2}", date_str):
-            date_str = re.sub(r"'(\d{2})", lambda m: "20" + m.group(1), date_str)
-
-        # Format tanggal yang mungkin
-        possible_formats = [
-            "%d %B %Y", "%d %b %Y", "%Y-%m-%d", "%d-%m-%Y",
-            "%Y %d %B", "%Y %d %b", "%Y, %d %B", "%Y, %d %b",
-            "%d %B", "%d %b %Y", "%d %B '%y", "%d %b '%y"
-        ]
-
-        for fmt in possible_formats:
-            try:
-                parsed = datetime.strptime(date_str, fmt)
-                return parsed.strftime("%d-%m-%Y")
-            except ValueError:
-                continue
-
-        # Coba gunakan pandas untuk format yang tidak terduga
-        try:
-            parsed = pd.to_datetime(date_str, errors='coerce', dayfirst=True)
-            if pd.notna(parsed):
-                return parsed.strftime("%d-%m-%Y")
-        except Exception:
-            pass
+# Pemetaan bulan bahasa Indonesia → Inggris
+bulan_map = {
+    "januari": "January", "jan": "Jan",
+    "februari": "February", "feb": "Feb",
+    "maret": "March", "mar": "Mar",
+    "april": "April", "apr": "Apr",
+    "mei": "May",
+    "juni": "June", "jun": "Jun",
+    "juli": "July", "jul": "Jul",
+    "agustus": "August", "agu": "Aug",
+    "september": "September", "sep": "Sep",
+    "oktober": "October", "okt": "Oct",
+    "november": "November", "nov": "Nov",
+    "desember": "December", "des": "Dec"
+}
+
+# Format tanggal yang mungkin
+possible_formats = [
+    "%d %B %Y", "%d %b %Y", "%Y-%m-%d", "%d-%m-%Y",
+    "%Y %d %B", "%Y %d %b", "%Y, %d %B", "%Y, %d %b",
+    "%d %B", "%d %b %Y", "%d %B '%y", "%d %b '%y"
+]
 
-        # Jika gagal total
+
+def parse_date(date_str):
+    if pd.isna(date_str):
         return date_str
 
-    # Terapkan ke kolom tanggal transaksi
-    df['tanggal transaksi'] = df['tanggal transaksi'].apply(parse_date)
+    # String mentah yang sama cukup di-parse sekali (lihat parse_cache)
+    return get_cache("parse_date").lookup(normalize_key(date_str), _parse_date)
+
+
+def _parse_date(date_str):
+    # Hapus tanda kutip atau koma
+    date_str = date_str.replace("‘", "'").replace("’", "'").replace(",", " ").replace(".", " ")
+    date_str = re.sub(r"\s+", " ", date_str).strip()
+
+    # Ubah bulan bahasa Indonesia → Inggris
+    for indo, eng in bulan_map.items():
+        pattern = re.compile(rf"\b{indo}\b", re.IGNORECASE)
+        date_str = pattern.sub(eng, date_str)
+
+    # Deteksi tahun dua digit dengan tanda kutip ('24 → 2024)
+    if re.search(r"'\d{2}", date_str):
+        date_str = re.sub(r"'(\d{2})", lambda m: "20" + m.group(1), date_str)
+
+    for fmt in possible_formats:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+            return parsed.strftime("%d-%m-%Y")
+        except ValueError:
+            continue
+
+    # Coba gunakan pandas untuk format yang tidak terduga
+    try:
+        parsed = pd.to_datetime(date_str, errors='coerce', dayfirst=True)
+        if pd.notna(parsed):
+            return parsed.strftime("%d-%m-%Y")
+    except Exception:
+        pass
+
+    # Jika gagal total
+    return date_str
+
+
+@dataclass
+class DatePlan:
+    # Urutan format yang dicoba per kolom, hasil sampling infer_date_plan
+    formats: list
+    sample_hits: dict
+    # Jumlah baris yang berhasil per format setelah parse_dates dijalankan;
+    # "lainnya" = baris yang diselesaikan parse_date per sel
+    hits: dict = field(default_factory=dict)
+
+
+_BULAN_REGEX = re.compile(r"\b(" + "|".join(bulan_map) + r")\b", re.IGNORECASE)
+
+
+def _preprocess(values: pd.Series) -> pd.Series:
+    # Langkah pembersihan parse_date dalam bentuk vektor
+    s = values.astype(str).str.strip()
+    s = s.str.replace("‘", "'").str.replace("’", "'").str.replace(",", " ").str.replace(".", " ")
+    s = s.str.replace(r"\s+", " ", regex=True).str.strip()
+    s = s.str.replace(_BULAN_REGEX, lambda m: bulan_map[m.group(1).lower()], regex=True)
+    return s.str.replace(r"'(\d{2})", r"20\1", regex=True)
+
+
+def infer_date_plan(values: pd.Series, sample_size: int = 500) -> DatePlan:
+    """Urutkan possible_formats berdasarkan hit rate pada sampel nilai unik kolom."""
+    sample = pd.Series(pd.Series(values).dropna().unique()[:sample_size], dtype=object)
+    sample = _preprocess(sample)
+    sample_hits = {}
+    for fmt in dict.fromkeys(possible_formats):
+        sample_hits[fmt] = int(pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum())
+    formats = sorted((f for f in sample_hits if sample_hits[f]), key=lambda f: -sample_hits[f])
+    return DatePlan(formats=formats, sample_hits=sample_hits)
+
+
+def parse_dates(values: pd.Series, plan: DatePlan = None) -> pd.Series:
+    """Versi vektor dari `values.apply(parse_date)` dengan hasil yang identik."""
+    values = pd.Series(values)
+    if plan is None:
+        plan = infer_date_plan(values)
+
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    raw = pd.Series(uniques, dtype=object)
+    hasil = pd.Series(None, index=raw.index, dtype=object)
+    sumber = pd.Series("lainnya", index=raw.index, dtype=object)
+
+    # Coba format dominan lebih dulu, lalu hanya sisa yang gagal ke format berikutnya
+    remaining = _preprocess(raw.dropna())
+    for fmt in plan.formats:
+        if remaining.empty:
+            break
+        parsed = pd.to_datetime(remaining, format=fmt, errors='coerce')
+        matched = remaining[parsed.notna()]
+        # parse_date mengambil format pertama yang cocok di possible_formats, jadi
+        # nilai yang oleh format sebelumnya dibaca sebagai tanggal lain diserahkan ke parse_date
+        for earlier in possible_formats[:possible_formats.index(fmt)]:
+            if matched.empty:
+                break
+            other = pd.to_datetime(matched, format=earlier, errors='coerce')
+            matched = matched[other.isna() | (other == parsed[matched.index])]
+        hasil[matched.index] = parsed[matched.index].dt.strftime("%d-%m-%Y")
+        sumber[matched.index] = fmt
+        remaining = remaining.drop(parsed.index[parsed.notna()])
+
+    # Sisanya diselesaikan parse_date per sel (termasuk fallback pandas)
+    sisa = sumber.index[sumber == "lainnya"]
+    hasil[sisa] = raw[sisa].map(parse_date)
+
+    counts = np.bincount(codes, minlength=len(raw)) if len(codes) else np.zeros(len(raw), dtype=int)
+    plan.hits = {k: int(v) for k, v in pd.Series(counts, index=sumber.to_numpy()).groupby(level=0, sort=False).sum().items()}
+    return pd.Series(hasil.to_numpy()[codes], index=values.index, name=values.name)
+
+
+def normalize_tanggal_transaksi(input_xlsx_path: str, output_xlsx_path: str) -> DatePlan:
+    # Baca file Excel
+    df = pd.read_excel(input_xlsx_path, sheet_name='transaksi')
+
+    # Terapkan ke kolom tanggal transaksi: format disusun sekali per kolom
+    plan = infer_date_plan(df['tanggal transaksi'])
+    df['tanggal transaksi'] = parse_dates(df['tanggal transaksi'], plan)
 
     # Simpan kembali ke Excel dengan urutan kolom tetap
     df.to_excel(output_xlsx_path, index=False)
+    return plan
 
 # Contoh penggunaan:
-normalize_tanggal_transaksi("penjualan_dqmart_01.xlsx", "penjualan_dqmart_01_output.xlsx")
+if __name__ == "__main__":
+    normalize_tanggal_transaksi("penjualan_dqmart_01.xlsx", "penjualan_dqmart_01_output.xlsx")
 
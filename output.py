@@ -0,0 +1,100 @@
+# output.py
+import os
+
+import pandas as pd
+
+FORMATS = ("xlsx", "csv", "parquet")
+
+
+def output_format_for(path: str, output_format: str = None) -> str:
+    # Format output: dipilih eksplisit, atau dari ekstensi file (default xlsx)
+    if output_format is None:
+        ext = os.path.splitext(str(path))[1].lower().lstrip(".")
+        output_format = ext if ext in FORMATS else "xlsx"
+    if output_format not in FORMATS:
+        raise ValueError(f"Format output '{output_format}' tidak dikenal, pilih salah satu dari {FORMATS}.")
+    return output_format
+
+
+def _write_xlsx(sheets, path):
+    from openpyxl import Workbook
+
+    # write_only=True menulis baris langsung ke file (memori konstan)
+    wb = Workbook(write_only=True)
+    for sheet_name, chunks in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        header = False
+        for chunk in chunks:
+            if not header:
+                ws.append([str(c) for c in chunk.columns])
+                header = True
+            values = chunk.astype(object).where(chunk.notna(), None)
+            for row in values.itertuples(index=False, name=None):
+                ws.append(row)
+    wb.save(path)
+
+
+def _write_csv(chunks, path):
+    header = True
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for chunk in chunks:
+            chunk.to_csv(f, index=False, header=header)
+            header = False
+
+
+def _write_parquet(chunks, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def skema(table):
+        # Kolom yang seluruhnya kosong bertipe null di Arrow; ditulis sebagai string agar
+        # potongan berikutnya yang berisi teks tetap bisa di-cast ke skema file
+        return pa.schema([f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in table.schema],
+                         table.schema.metadata)
+
+    # Potongan kosong di depan (mis. sheet yang hanya berisi header) belum menentukan
+    # skema; tanpa potongan berisi, file tetap ditulis sebagai tabel kosong dengan kolomnya
+    writer, schema, kosong = None, None, None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                if table.num_rows == 0:
+                    kosong = kosong or table
+                    continue
+                schema = skema(table)
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(table.cast(schema))
+        if writer is None:
+            table = kosong if kosong is not None else pa.table({})
+            pq.write_table(table.cast(skema(table)), path)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_table(chunks, output_path: str, sheet_name: str = "Sheet1", output_format: str = None) -> None:
+    """Tulis DataFrame atau potongan-potongan DataFrame ke xlsx/csv/parquet secara streaming."""
+    write_sheets({sheet_name: chunks}, output_path, output_format)
+
+
+def write_sheets(sheets: dict, output_path: str, output_format: str = None) -> list:
+    """Tulis beberapa tabel sekaligus: satu sheet per tabel untuk xlsx. Untuk csv/parquet
+    tabel pertama ditulis ke `output_path` dan sisanya ke `<nama>_<sheet>.<ext>`.
+    Mengembalikan daftar file yang ditulis."""
+    sheets = {name: [t] if isinstance(t, pd.DataFrame) else t for name, t in sheets.items()}
+    output_format = output_format_for(output_path, output_format)
+    if output_format == "xlsx":
+        _write_xlsx(sheets, output_path)
+        return [output_path]
+
+    stem, ext = os.path.splitext(str(output_path))
+    paths = []
+    for i, (sheet_name, chunks) in enumerate(sheets.items()):
+        path = output_path if i == 0 else f"{stem}_{sheet_name}{ext or '.' + output_format}"
+        if output_format == "csv":
+            _write_csv(chunks, path)
+        else:
+            _write_parquet(chunks, path)
+        paths.append(path)
+    return paths
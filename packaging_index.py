@@ -0,0 +1,114 @@
+# packaging_index.py
+# Contoh:
+#   run_analysis("transaksi_dqmart.xlsx", "product_packaging.xlsx", index_path="product_packaging.idx")
+#   index = PackagingIndex("product_packaging.idx")
+#   index.query(["Roti", "Susu"], top_n=5)
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+INDEX_VERSION = 1
+
+# Nama file array di dalam direktori index (semua .npy, dibuka dengan mmap)
+_ARRAYS = ("offsets", "postings", "set_ids", "lift", "confidence", "set_offsets", "set_items")
+
+
+def write_index(packaging: pd.DataFrame, index_path: str) -> str:
+    """Simpan tabel Packaging sebagai index produk -> posting list set.
+
+    Set diberi peringkat menurut lift lalu confidence (menurun); posting list
+    setiap produk berisi peringkat set yang memuatnya, terurut naik, sehingga
+    urutannya sama dengan urutan lift. Semua array disimpan sebagai .npy agar
+    bisa dibuka dengan mmap tanpa membaca seluruh file."""
+    order = np.lexsort((-packaging["Maximum_Confidence"].to_numpy(), -packaging["Maximum_Lift"].to_numpy()))
+    packaging = packaging.iloc[order]
+    members = packaging["Products"].astype(str).str.split(";")
+    lengths = members.map(len).to_numpy(dtype=np.int64)
+    pid, products = pd.factorize(np.concatenate(members.to_list()) if len(members) else np.empty(0, dtype=object),
+                                 sort=True)
+    rank = np.repeat(np.arange(len(packaging), dtype=np.int32), lengths)
+
+    # Posting list: pasangan (produk, peringkat) diurutkan per produk lalu peringkat
+    by_product = np.lexsort((rank, pid))
+    offsets = np.zeros(len(products) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pid, minlength=len(products)), out=offsets[1:])
+
+    arrays = {
+        "offsets": offsets,
+        "postings": rank[by_product],
+        "set_ids": packaging["Packaging Set ID"].to_numpy(dtype=np.int64),
+        "lift": packaging["Maximum_Lift"].to_numpy(dtype=np.float64),
+        "confidence": packaging["Maximum_Confidence"].to_numpy(dtype=np.float64),
+        "set_offsets": np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+        "set_items": pid.astype(np.int32),
+    }
+    os.makedirs(index_path, exist_ok=True)
+    for name in _ARRAYS:
+        np.save(os.path.join(index_path, f"{name}.npy"), arrays[name])
+    with open(os.path.join(index_path, "products.json"), "w", encoding="utf-8") as f:
+        json.dump([str(p) for p in products], f, ensure_ascii=False)
+    with open(os.path.join(index_path, "meta.json"), "w") as f:
+        json.dump({"version": INDEX_VERSION, "sets": len(packaging), "products": len(products)}, f)
+    return index_path
+
+
+class PackagingIndex:
+    """Index hasil write_index, dibuka sekali lalu dipakai untuk banyak query."""
+
+    def __init__(self, index_path: str):
+        with open(os.path.join(index_path, "meta.json")) as f:
+            meta = json.load(f)
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Versi index {meta.get('version')} tidak didukung (harus {INDEX_VERSION}).")
+        with open(os.path.join(index_path, "products.json"), encoding="utf-8") as f:
+            self.products = json.load(f)
+        self.product_ids = {name: i for i, name in enumerate(self.products)}
+        # np.asarray: view ndarray biasa di atas mmap (operasi memmap lebih lambat)
+        for name in _ARRAYS:
+            setattr(self, name, np.asarray(np.load(os.path.join(index_path, f"{name}.npy"), mmap_mode="r")))
+
+    def __len__(self) -> int:
+        return len(self.set_ids)
+
+    def query_ranks(self, cart, top_n: int = 10) -> np.ndarray:
+        # Peringkat set yang memuat semua produk di cart (lift tertinggi dulu).
+        # Posting list terpendek dipotong per blok dan dicocokkan ke list lain dengan
+        # binary search, berhenti begitu top_n set ditemukan
+        pids = {self.product_ids.get(name, -1) for name in cart}
+        if not pids or -1 in pids:
+            return np.empty(0, dtype=np.int32)
+        lists = sorted((self.postings[self.offsets[p]:self.offsets[p + 1]] for p in pids), key=len)
+        first, rest = lists[0], lists[1:]
+        if not rest:
+            return first[:top_n]
+
+        found, n_found = [], 0
+        step = max(64, 4 * top_n)
+        for start in range(0, len(first), step):
+            cand = first[start:start + step]
+            for other in rest:
+                pos = np.minimum(np.searchsorted(other, cand), len(other) - 1)
+                cand = cand[other[pos] == cand]
+                if not len(cand):
+                    break
+            found.append(cand)
+            n_found += len(cand)
+            if n_found >= top_n:
+                break
+        return np.concatenate(found)[:top_n] if found else np.empty(0, dtype=np.int32)
+
+    def query(self, cart, top_n: int = 10) -> list:
+        """Top-N set packaging yang memuat semua produk di `cart`, lift tertinggi dulu."""
+        ranks = self.query_ranks(cart, top_n)
+        # Decode sekaligus per array lalu ke tipe Python (indexing skalar numpy lambat)
+        starts, ends = self.set_offsets[ranks].tolist(), self.set_offsets[ranks + 1].tolist()
+        return [
+            {"Packaging Set ID": set_id,
+             "Products": [self.products[i] for i in self.set_items[start:end].tolist()],
+             "Maximum_Lift": lift,
+             "Maximum_Confidence": conf}
+            for set_id, start, end, lift, conf in zip(self.set_ids[ranks].tolist(), starts, ends,
+                                                      self.lift[ranks].tolist(), self.confidence[ranks].tolist())
+        ]
@@ -0,0 +1,33 @@
+# parallel.py
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def split_rows(df, n_shards: int):
+    # Potong DataFrame menjadi maksimal n_shards bagian berurutan
+    if n_shards <= 1 or len(df) <= 1:
+        yield df
+        return
+    for idx in np.array_split(np.arange(len(df)), min(n_shards, len(df))):
+        yield df.iloc[idx[0]:idx[-1] + 1]
+
+
+def imap_ordered(func, items, workers: int = 1, max_pending: int = None):
+    """Seperti map(func, items), tetapi dijalankan di process pool berisi `workers`
+    proses. Hasil tetap keluar sesuai urutan input dan jumlah item yang sedang
+    diproses dibatasi agar pemakaian memori tidak ikut membesar."""
+    if workers <= 1:
+        yield from map(func, items)
+        return
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
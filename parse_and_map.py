@@ -1,37 +1,68 @@
-import pandas as pd
 import re
 from datetime import datetime
 
+from parse_cache import get_cache
+from profiling import NO_PROFILE
+
+# pandas, pyarrow dan modul I/O baru di-import saat versi vektor atau process_excel
+# dipanggil, jadi extract_date_from_keterangan bisa di-import tanpa biaya start-up pandas
+_ARROW = None
+
+def _arrow():
+    # (pyarrow, pyarrow.compute), atau (None, None) jika pyarrow tidak terpasang;
+    # tanpa pyarrow dipakai str.extract pandas
+    global _ARROW
+    if _ARROW is None:
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            _ARROW = (pa, pc)
+        except ImportError:
+            _ARROW = (None, None)
+    return _ARROW
+
 def extract_date_from_keterangan(keterangan):
-    # Menyusun pola regex untuk mencocokkan tanggal dalam berbagai format, termasuk koma dan spasi
-    date_pattern = r'(\d{4}),?\s*(\d{1,2})\s*([A-Za-z]+|[A-Za-z]{3})|(\d{1,2})\s([A-Za-z]+|[A-Za-z]{3})\s(\d{2,4}|\'\d{2})'
-    
+    # Keterangan yang sama cukup diekstrak sekali (lihat parse_cache); kuncinya
+    # string apa adanya karena pola regex peka terhadap spasi
+    return get_cache("keterangan").lookup(keterangan, _extract_date)
+
+# Pola regex untuk mencocokkan tanggal dalam berbagai format, termasuk koma dan spasi,
+# dikompilasi sekali: "2024, 27 Aug" (grup *_a) atau "25 Jun '24" / "7 August 2024" (grup *_b)
+_DATE_TEMPLATE = (
+    r'(?P<tahun_a>{d}{{4}}),?{s}*(?P<hari_a>{d}{{1,2}}){s}*(?P<bulan_a>[A-Za-z]+|[A-Za-z]{{3}})'
+    r'|(?P<hari_b>{d}{{1,2}}){s}(?P<bulan_b>[A-Za-z]+|[A-Za-z]{{3}}){s}(?P<tahun_b>{d}{{2,4}}|\'{d}{{2}})'
+)
+DATE_PATTERN = re.compile(_DATE_TEMPLATE.format(d=r'\d', s=r'\s'))
+# Pola yang sama untuk RE2 (pyarrow), khusus teks ASCII: \d dan \s Python ditulis eksplisit
+_DATE_PATTERN_ASCII = _DATE_TEMPLATE.format(d='[0-9]', s=r'[\t\n\x0b\x0c\r\x1c-\x1f ]')
+
+# Menyusun nama bulan dengan angka
+month_dict = {
+    "Januari": 1, "Februari": 2, "Maret":3, "April": 4,
+    "Mei": 5, "June": 6, "Jul": 7, "Agustus": 8,
+    "September": 9, "Oktober": 10, "November": 11, "Desember": 12,
+    "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+    ,"Okt":10,"Mar":3,"August":7,"Juni":6 # Untuk singkatan bulan
+}
+
+def _extract_date(keterangan):
     # Mencocokkan regex
-    match = re.search(date_pattern, keterangan)
+    match = DATE_PATTERN.search(keterangan)
     
     if match:
         # Jika ada tahun di awal
-        if match.group(1):  # Format "2024, 27 Aug"
-            year = match.group(1)
-            day = match.group(2)
-            month_name = match.group(3)
+        if match.group('tahun_a'):  # Format "2024, 27 Aug"
+            year = match.group('tahun_a')
+            day = match.group('hari_a')
+            month_name = match.group('bulan_a')
         # Jika tahun di belakang (misal format '25 Jun '24')
         else:  # Format '25 Jun '24' atau '7 August 2024'
-            day = match.group(4)
-            month_name = match.group(5)
-            year = match.group(6)
+            day = match.group('hari_b')
+            month_name = match.group('bulan_b')
+            year = match.group('tahun_b')
             if year.startswith("'"):  # Jika tahun dua digit
                 year = '20' + year[1:]
         
-        # Menyusun nama bulan dengan angka
-        month_dict = {
-            "Januari": 1, "Februari": 2, "Maret":3, "April": 4,
-            "Mei": 5, "June": 6, "Jul": 7, "Agustus": 8,
-            "September": 9, "Oktober": 10, "November": 11, "Desember": 12,
-            "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
-            ,"Okt":10,"Mar":3,"August":7,"Juni":6 # Untuk singkatan bulan
-        }
-        
         if month_name in month_dict:
             month = month_dict[month_name]
             # Mengonversi tanggal menjadi format dd-mm-yyyy
@@ -39,16 +70,87 @@ def extract_date_from_keterangan(keterangan):
             return date_string
     return None
 
-def process_excel(input_path, output_path, sheet_name='transaksi'):
-    # Baca file Excel input dan pilih sheet yang sesuai dengan sheet_name
-    df = pd.read_excel(input_path, sheet_name=sheet_name)
-    
+def _extract_dates_pandas(keterangan):
+    index = keterangan.index
+    keterangan = keterangan.reset_index(drop=True)
+    parts = keterangan.str.extract(DATE_PATTERN)
+    tahun_awal = parts['tahun_a'].notna()
+    day = parts['hari_a'].where(tahun_awal, parts['hari_b'])
+    month_name = parts['bulan_a'].where(tahun_awal, parts['bulan_b'])
+    year = parts['tahun_a'].where(tahun_awal, parts['tahun_b'])
+    year = year.where(~year.str.startswith("'", na=False), '20' + year.str[1:])
+
+    month = month_name.map(month_dict)
+    found = month.notna()
+    date_string = day[found] + '-' + month[found].astype(int).astype(str).str.zfill(2) + '-' + year[found]
+    hasil = date_string.reindex(keterangan.index).astype(object).where(found, None)
+    return hasil.set_axis(index)
+
+def _extract_dates_arrow(arr):
+    # Langkah yang sama dengan _extract_dates_pandas, seluruhnya di compute kernel pyarrow
+    pa, pc = _arrow()
+    parts = pc.extract_regex(arr, pattern=_DATE_PATTERN_ASCII)
+    field = {name: pc.struct_field(parts, [i]) for i, name in enumerate(DATE_PATTERN.groupindex)}
+    tahun_awal = pc.not_equal(field['tahun_a'], '')
+    day = pc.if_else(tahun_awal, field['hari_a'], field['hari_b'])
+    month_name = pc.if_else(tahun_awal, field['bulan_a'], field['bulan_b'])
+    year = pc.if_else(tahun_awal, field['tahun_a'], field['tahun_b'])
+    year = pc.if_else(pc.starts_with(year, "'"), pc.binary_join_element_wise('20', pc.utf8_slice_codeunits(year, 1), ''), year)
+
+    month = pc.take(
+        pa.array([f"{m:02d}" for m in month_dict.values()]),
+        pc.index_in(month_name, value_set=pa.array(list(month_dict))),
+    )
+    return pc.binary_join_element_wise(day, month, year, '-')
+
+def extract_dates(keterangan):
+    # Versi vektor dari keterangan.apply(extract_date_from_keterangan): satu kali
+    # ekstraksi regex untuk seluruh kolom, lalu bulan dipetakan dengan map.
+    # Nilai yang bukan teks (sel kosong) menghasilkan None.
+    import pandas as pd
+    pa, pc = _arrow()
+    keterangan = pd.Series(keterangan)
+    arr = None
+    if pc is not None:
+        try:
+            arr = pa.array(keterangan.to_numpy(), type=pa.string(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arr = None
+    if arr is None:
+        return _extract_dates_pandas(keterangan).rename(keterangan.name)
+
+    # Teks ASCII lewat RE2 pyarrow; teks non-ASCII tetap lewat regex Python
+    # karena \d dan \s Python juga mencocokkan karakter Unicode
+    ascii_mask = pc.fill_null(pc.string_is_ascii(arr), True)
+    hasil = pc.if_else(ascii_mask, _extract_dates_arrow(arr), None).to_numpy(zero_copy_only=False)
+    hasil = pd.Series(hasil, index=keterangan.index, dtype=object, name=keterangan.name)
+    lainnya = ~ascii_mask.to_numpy(zero_copy_only=False)
+    if lainnya.any():
+        hasil[lainnya] = _extract_dates_pandas(keterangan[lainnya])
+    return hasil
+
+def _extract_shard(df):
     # Tambahkan kolom 'Tanggal Transaksi' dengan hasil ekstraksi dari kolom 'Keterangan'
-    df['Tanggal Transaksi'] = df['Keterangan'].apply(extract_date_from_keterangan)
-    
-    # Simpan hasil ke file output dengan nama sheet yang ditentukan
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name=sheet_name, index=False)
+    # (lewat assign, karena potongan dari split_rows adalah irisan iloc)
+    return df.assign(**{'Tanggal Transaksi': extract_dates(df['Keterangan'])})
+
+def process_excel(input_path, output_path, sheet_name='transaksi', workers=1, output_format=None, profile=None):
+    from ingest import read_chunks
+    from output import write_table
+    from parallel import imap_ordered, split_rows
+
+    # `profile`: StageProfiler opsional untuk waktu/memori per tahap (lihat profiling.py)
+    prof = profile or NO_PROFILE
+    with prof.run("keterangan"):
+        # Baca file Excel input per potongan dari sheet yang sesuai dengan sheet_name,
+        # bagi ke `workers` proses lalu susun kembali sesuai urutan asli
+        chunks = prof.count_in("extract", prof.iter("read", read_chunks(input_path, sheet_name=sheet_name)))
+        shards = (shard for df in chunks for shard in split_rows(df, workers))
+        hasil = prof.iter("extract", imap_ordered(_extract_shard, shards, workers))
+
+        # Simpan hasil ke file output dengan nama sheet yang ditentukan (streaming per potongan)
+        with prof.stage("write"):
+            write_table(prof.count_in("write", hasil), output_path, sheet_name=sheet_name, output_format=output_format)
 
 # Pemanggilan fungsi dengan sheet_name
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+# parse_cache.py
+from collections import OrderedDict
+from threading import Lock
+
+DEFAULT_MAXSIZE = 100_000
+
+
+def normalize_key(raw) -> str:
+    # Kunci cache: string mentah tanpa spasi berlebih di awal/akhir/tengah
+    return " ".join(str(raw).split())
+
+
+class ParseCache:
+    """Cache LRU berukuran terbatas untuk hasil parsing string mentah."""
+
+    def __init__(self, name: str, maxsize: int = DEFAULT_MAXSIZE):
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = Lock()
+
+    def lookup(self, key, parse):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        value = parse(key)
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+
+
+_caches = {}
+
+
+def get_cache(name: str) -> ParseCache:
+    # Satu cache per parser (fix_date, parse_date, keterangan), dibagi antar modul
+    if name not in _caches:
+        _caches[name] = ParseCache(name, DEFAULT_MAXSIZE)
+    return _caches[name]
+
+
+def set_maxsize(maxsize: int) -> None:
+    global DEFAULT_MAXSIZE
+    DEFAULT_MAXSIZE = maxsize
+    for cache in _caches.values():
+        cache.resize(maxsize)
+
+
+def cache_stats() -> dict:
+    return {name: cache.stats() for name, cache in _caches.items()}
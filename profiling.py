@@ -0,0 +1,239 @@
+# profiling.py
+# Contoh:
+#   prof = StageProfiler(hook="cprofile")
+#   run_analysis("transaksi_dqmart.xlsx", "product_packaging.xlsx", profile=prof)
+#   prof.print_log(); prof.save("profil.json")
+import io
+import json
+import resource
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+HOOKS = ("cprofile", "tracemalloc")
+
+
+def _rss_mib() -> float:
+    # ru_maxrss: KiB di Linux, byte di macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+class Stage:
+    # Catatan satu tahap; waktu bersifat eksklusif (waktu tahap lain yang berjalan
+    # di dalamnya, mis. generator pembaca yang dikonsumsi penulis, tidak ikut dihitung)
+    __slots__ = ("name", "calls", "wall_s", "cpu_s", "rows_in", "rows_out",
+                 "peak_rss_mib", "rss_growth_mib", "py_peak_mib")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.wall_s = self.cpu_s = 0.0
+        self.rows_in = self.rows_out = None
+        self.peak_rss_mib = self.rss_growth_mib = 0.0
+        self.py_peak_mib = None
+
+    def add_rows(self, rows_in: int = None, rows_out: int = None) -> None:
+        if rows_in is not None:
+            self.rows_in = (self.rows_in or 0) + int(rows_in)
+        if rows_out is not None:
+            self.rows_out = (self.rows_out or 0) + int(rows_out)
+
+    def to_dict(self) -> dict:
+        hasil = {
+            "stage": self.name, "calls": self.calls,
+            "wall_s": round(self.wall_s, 4), "cpu_s": round(self.cpu_s, 4),
+            "rows_in": self.rows_in, "rows_out": self.rows_out,
+            "peak_rss_mib": round(self.peak_rss_mib, 1), "rss_growth_mib": round(self.rss_growth_mib, 1),
+        }
+        if self.py_peak_mib is not None:
+            hasil["py_peak_mib"] = round(self.py_peak_mib, 1)
+        return hasil
+
+
+class StageProfiler:
+    """Waktu wall/CPU, puncak RSS dan jumlah baris masuk/keluar per tahap pipeline.
+
+    `hook` opsional: "cprofile" (statistik fungsi seluruh run, disimpan ke
+    `hook_output` jika diisi) atau "tracemalloc" (puncak alokasi Python per tahap
+    dan baris kode dengan alokasi terbesar)."""
+
+    def __init__(self, hook: str = None, hook_output: str = None):
+        if hook is not None and hook not in HOOKS:
+            raise ValueError(f"Hook '{hook}' tidak dikenal, pilih salah satu dari {list(HOOKS)}.")
+        self.hook = hook
+        self.hook_output = hook_output
+        self.pipeline = None
+        self.stages = {}
+        self.total = {}
+        self.hook_report = None
+        self._stack = []
+        self._mark = None
+        self._rss_enter = []
+
+    def _switch(self):
+        # Tutup interval yang sedang berjalan dan tambahkan ke tahap teratas di stack
+        now = (time.perf_counter(), time.process_time())
+        if self._stack:
+            top = self._stack[-1]
+            top.wall_s += now[0] - self._mark[0]
+            top.cpu_s += now[1] - self._mark[1]
+            if self.hook == "tracemalloc":
+                import tracemalloc
+                peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+                top.py_peak_mib = max(top.py_peak_mib or 0.0, peak)
+                tracemalloc.reset_peak()
+        self._mark = now
+
+    def _enter(self, name: str) -> Stage:
+        self._switch()
+        stage = self._get(name)
+        stage.calls += 1
+        self._stack.append(stage)
+        self._rss_enter.append(_rss_mib())
+        return stage
+
+    def _exit(self) -> None:
+        self._switch()
+        stage = self._stack.pop()
+        rss = _rss_mib()
+        stage.peak_rss_mib = max(stage.peak_rss_mib, rss)
+        stage.rss_growth_mib += rss - self._rss_enter.pop()
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int = None):
+        # Blok kode satu tahap; jumlah baris keluar diisi lewat stage.add_rows(rows_out=...)
+        stage = self._enter(name)
+        stage.add_rows(rows_in=rows_in)
+        try:
+            yield stage
+        finally:
+            self._exit()
+
+    def _get(self, name: str) -> Stage:
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name)
+        return stage
+
+    def iter(self, name: str, items, rows=len):
+        # Bungkus generator tahap streaming: hanya waktu di dalam next() yang dihitung,
+        # rows(item) dijumlahkan sebagai baris keluar
+        self._get(name)
+        return self._iter(name, iter(items), rows)
+
+    def _iter(self, name, it, rows):
+        while True:
+            stage = self._enter(name)
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            stage.add_rows(rows_out=rows(item))
+            yield item
+
+    def count_in(self, name: str, items, rows=len):
+        # Hitung baris masuk tahap `name` dari item yang dikonsumsinya (tanpa pencatatan waktu)
+        stage = self._get(name)
+        return (stage.add_rows(rows_in=rows(item)) or item for item in items)
+
+    @contextmanager
+    def run(self, pipeline: str):
+        self.pipeline = pipeline
+        profiler = None
+        if self.hook == "cprofile":
+            import cProfile
+            profiler = cProfile.Profile()
+        elif self.hook == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start()
+
+        rss_before = _rss_mib()
+        start, cpu_start = time.perf_counter(), time.process_time()
+        children_start = resource.getrusage(resource.RUSAGE_CHILDREN)
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield self
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            children = resource.getrusage(resource.RUSAGE_CHILDREN)
+            self.total = {
+                "wall_s": round(time.perf_counter() - start, 4),
+                "cpu_s": round(time.process_time() - cpu_start, 4),
+                # CPU proses worker (workers > 1) yang sudah selesai
+                "children_cpu_s": round(max(children.ru_utime + children.ru_stime
+                                            - children_start.ru_utime - children_start.ru_stime, 0.0), 4),
+                "rss_before_mib": round(rss_before, 1),
+                "peak_rss_mib": round(_rss_mib(), 1),
+            }
+            if profiler is not None:
+                self._finish_cprofile(profiler)
+            elif self.hook == "tracemalloc":
+                self._finish_tracemalloc()
+
+    def _finish_cprofile(self, profiler) -> None:
+        import pstats
+        if self.hook_output:
+            profiler.dump_stats(self.hook_output)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(20)
+        self.hook_report = out.getvalue()
+
+    def _finish_tracemalloc(self) -> None:
+        import tracemalloc
+        top = tracemalloc.take_snapshot().statistics("lineno")[:20]
+        tracemalloc.stop()
+        self.hook_report = [str(stat) for stat in top]
+        if self.hook_output:
+            with open(self.hook_output, "w") as f:
+                f.write("\n".join(self.hook_report) + "\n")
+
+    def report(self) -> dict:
+        hasil = {"pipeline": self.pipeline, "total": self.total,
+                 "stages": [stage.to_dict() for stage in self.stages.values()]}
+        if self.hook:
+            hasil["hook"] = self.hook
+            if isinstance(self.hook_report, list):
+                hasil["tracemalloc_top"] = self.hook_report
+        return hasil
+
+    def log_lines(self) -> list:
+        lines = []
+        for s in self.report()["stages"]:
+            fields = " ".join(f"{k}={v}" for k, v in s.items() if k != "stage" and v is not None)
+            lines.append(f"[PROFIL] {self.pipeline} stage={s['stage']} {fields}")
+        fields = " ".join(f"{k}={v}" for k, v in self.total.items())
+        lines.append(f"[PROFIL] {self.pipeline} total {fields}")
+        return lines
+
+    def print_log(self) -> None:
+        for line in self.log_lines():
+            print(line)
+        if isinstance(self.hook_report, str):
+            print(self.hook_report)
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+
+class _NoProfiler:
+    # Dipakai saat profiling tidak aktif: tanpa pencatatan waktu maupun syscall
+    def stage(self, name, rows_in=None):
+        return nullcontext(Stage(name))
+
+    def iter(self, name, items, rows=len):
+        return items
+
+    def count_in(self, name, items, rows=len):
+        return items
+
+    def run(self, pipeline):
+        return nullcontext(self)
+
+
+NO_PROFILE = _NoProfiler()
@@ -0,0 +1,220 @@
+# rules.py
+import heapq
+from dataclasses import dataclass
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class EncodedItemsets:
+    # Frequent itemset dalam bentuk id integer: itemset ke-i berisi
+    # ids[starts[i]:starts[i] + lengths[i]] (id terurut, sesuai urutan nama produk)
+    products: np.ndarray
+    ids: np.ndarray
+    starts: np.ndarray
+    lengths: np.ndarray
+    support: np.ndarray
+
+    def level(self, k: int):
+        # Posisi itemset berukuran k dan matrix id-nya (satu baris per itemset)
+        rows = np.flatnonzero(self.lengths == k)
+        return rows, self.ids[self.starts[rows][:, None] + np.arange(k)]
+
+    def name_rank(self) -> np.ndarray:
+        # Peringkat setiap itemset menurut tuple nama produknya (leksikografis),
+        # pemutus seri yang tidak bergantung pada urutan itemset dari backend mining
+        width = int(self.lengths.max()) if len(self.lengths) else 0
+        padded = np.full((len(self.lengths), width), -1, dtype=np.int64)
+        mask = np.arange(width) < self.lengths[:, None]
+        padded[mask] = self.ids
+        rank = np.empty(len(self.lengths), dtype=np.int64)
+        rank[np.lexsort(padded.T[::-1])] = np.arange(len(self.lengths))
+        return rank
+
+    def names(self, rows) -> list:
+        # Decode ke nama produk digabung ';' (hanya untuk baris yang ditampilkan)
+        return [";".join(self.products[self.ids[s:s + n]]) for s, n in zip(self.starts[rows], self.lengths[rows])]
+
+
+def encode_itemsets(itemsets: pd.DataFrame) -> EncodedItemsets:
+    # frozenset nama produk (format mlxtend) -> id integer terurut per itemset
+    sets = itemsets["itemsets"].reset_index(drop=True)
+    lengths = sets.map(len).to_numpy(dtype=np.int64)
+    ids, products = pd.factorize(sets.map(sorted).explode().dropna().to_numpy(), sort=True)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if len(lengths) else np.empty(0, dtype=np.int64)
+    return EncodedItemsets(
+        products=np.asarray(products, dtype=object),
+        ids=ids.astype(np.int64),
+        starts=starts.astype(np.int64),
+        lengths=lengths,
+        support=itemsets["support"].to_numpy(dtype=float),
+    )
+
+
+def _keys(ids: np.ndarray, n_products: int):
+    # Satu kunci int64 per baris id (basis n_products); None jika bisa overflow
+    k = ids.shape[1]
+    if max(n_products, 2) ** k >= 2 ** 63:
+        return None
+    radix = np.array([n_products ** (k - 1 - j) for j in range(k)], dtype=np.int64)
+    return ids @ radix
+
+
+def _lookup(enc: EncodedItemsets, k: int):
+    # Index itemset berukuran k untuk mencari support subset secara vektor
+    rows, ids = enc.level(k)
+    keys = _keys(ids, len(enc.products))
+    if keys is not None:
+        return rows, pd.Index(keys)
+    return rows, pd.MultiIndex.from_arrays(list(ids.T))
+
+
+def _find(index: pd.Index, ids: np.ndarray, n_products: int) -> np.ndarray:
+    if isinstance(index, pd.MultiIndex):
+        return index.get_indexer(pd.MultiIndex.from_arrays(list(ids.T)))
+    return index.get_indexer(_keys(ids, n_products))
+
+
+class _RuleScorer:
+    # Menghitung lift/confidence maksimum untuk sebagian itemset; index subset
+    # per ukuran dibangun sekali lalu dipakai ulang antar panggilan
+    def __init__(self, enc: EncodedItemsets, min_threshold: float):
+        self.enc = enc
+        self.min_threshold = min_threshold
+        self._lookups = {}
+
+    def _lookup(self, k: int):
+        if k not in self._lookups:
+            self._lookups[k] = _lookup(self.enc, k)
+        return self._lookups[k]
+
+    def upper_bound(self, rows: np.ndarray) -> np.ndarray:
+        # Batas atas lift semua rule dari itemset S: setiap antecedent dan consequent
+        # adalah subset dari S minus satu item, jadi supportnya >= m = support minimum
+        # subset berukuran k-1, dan lift = s(S) / (s(A) s(C)) <= s(S) / m^2
+        enc, n = self.enc, len(self.enc.products)
+        bound = np.full(len(rows), np.inf)
+        for k in np.unique(enc.lengths[rows]):
+            k = int(k)
+            if k < 2:
+                continue
+            sel = np.flatnonzero(enc.lengths[rows] == k)
+            ids = enc.ids[enc.starts[rows[sel]][:, None] + np.arange(k)]
+            sub_rows, sub_index = self._lookup(k - 1)
+            m = np.full(len(sel), np.inf)
+            for drop in range(k):
+                pos = _find(sub_index, np.delete(ids, drop, axis=1), n)
+                # Subset yang tidak ada: m = 0 (tanpa batas, itemset tetap dihitung penuh)
+                sub = enc.support[sub_rows[np.maximum(pos, 0)]] if len(sub_rows) else np.zeros(len(sel))
+                m = np.minimum(m, np.where(pos >= 0, sub, 0.0))
+            # Sedikit dilonggarkan agar pembulatan float pada lift tidak membuat batas terlewati
+            with np.errstate(divide="ignore"):
+                bound[sel] = enc.support[rows[sel]] / (m * m) * (1 + 1e-9)
+        return bound
+
+    def score(self, rows: np.ndarray):
+        # (max lift, max confidence, support antecedent, support consequent) per baris
+        # `rows`; dua yang terakhir milik rule dengan lift maksimum. -inf jika tidak ada rule
+        enc, n = self.enc, len(self.enc.products)
+        max_lift = np.full(len(rows), -np.inf)
+        max_conf = np.full(len(rows), -np.inf)
+        best_a = np.full(len(rows), np.nan)
+        best_c = np.full(len(rows), np.nan)
+        for k in np.unique(enc.lengths[rows]):
+            k = int(k)
+            if k < 2:
+                continue
+            sel = np.flatnonzero(enc.lengths[rows] == k)
+            ids = enc.ids[enc.starts[rows[sel]][:, None] + np.arange(k)]
+            s_ac = enc.support[rows[sel]]
+            for r in range(1, k):
+                a_rows, a_index = self._lookup(r)
+                c_rows, c_index = self._lookup(k - r)
+                if len(a_rows) == 0 or len(c_rows) == 0:
+                    continue
+                for ante in combinations(range(k), r):
+                    cons = [j for j in range(k) if j not in ante]
+                    a_pos, c_pos = _find(a_index, ids[:, list(ante)], n), _find(c_index, ids[:, cons], n)
+                    # Subset yang tidak ada di daftar itemset tidak menghasilkan rule
+                    found = (a_pos >= 0) & (c_pos >= 0)
+                    s_a = np.where(found, enc.support[a_rows[a_pos]], np.nan)
+                    s_c = np.where(found, enc.support[c_rows[c_pos]], np.nan)
+                    # Rumus sama dengan mlxtend association_rules
+                    conf = s_ac / s_a
+                    lift = conf / s_c
+                    ok = found & (conf >= self.min_threshold)
+                    # Setiap itemset muncul sekali per kombinasi, jadi indeks tidak berulang
+                    target = sel[ok]
+                    better = lift[ok] > max_lift[target]
+                    best_a[target[better]] = s_a[ok][better]
+                    best_c[target[better]] = s_c[ok][better]
+                    max_lift[target] = np.maximum(max_lift[target], lift[ok])
+                    max_conf[target] = np.maximum(max_conf[target], conf[ok])
+        return max_lift, max_conf, best_a, best_c
+
+
+def rule_maxima(enc: EncodedItemsets, min_threshold: float = 0.4):
+    """Lift dan confidence maksimum per itemset dari semua rule A -> S \\ A dengan confidence >= min_threshold.
+
+    Gabungan antecedent dan consequent sebuah rule selalu itemset asalnya, jadi
+    pengelompokan per union_set cukup dilakukan per baris itemset. Hasil berupa
+    (posisi itemset, max lift, max confidence) untuk itemset yang punya rule."""
+    rows, max_lift, max_conf, _, _ = rule_details(enc, min_threshold)
+    return rows, max_lift, max_conf
+
+
+def rule_details(enc: EncodedItemsets, min_threshold: float = 0.4):
+    # Seperti rule_maxima, ditambah support antecedent dan consequent dari rule
+    # dengan lift maksimum (untuk interval kepercayaan lift di mode sampel)
+    rows = np.flatnonzero(enc.lengths >= 2)
+    max_lift, max_conf, s_a, s_c = _RuleScorer(enc, min_threshold).score(rows)
+    has_rule = np.isfinite(max_conf)
+    return rows[has_rule], max_lift[has_rule], max_conf[has_rule], s_a[has_rule], s_c[has_rule]
+
+
+def top_rule_maxima(enc: EncodedItemsets, top_k: int, min_threshold: float = 0.4, block: int = 1024):
+    """Seperti rule_maxima, tetapi hanya `top_k` itemset teratas (lift lalu confidence, menurun).
+
+    Itemset diproses dari batas atas lift terbesar (lihat _RuleScorer.upper_bound);
+    begitu batas atas blok berikutnya di bawah lift ke-K di heap, rule untuk sisa
+    itemset tidak perlu dibangkitkan."""
+    scorer = _RuleScorer(enc, min_threshold)
+    rows = np.flatnonzero(enc.lengths >= 2)
+    bound = scorer.upper_bound(rows)
+    order = np.argsort(-bound, kind="stable")
+    rows, bound = rows[order], bound[order]
+
+    # Min-heap berukuran top_k; kunci (lift, confidence, -peringkat nama) sehingga
+    # seri diputus menurut nama produk, sama seperti pengurutan penuh di build_packaging
+    rank = enc.name_rank()
+    heap = []
+    size = max(block, 4 * top_k)
+    i = 0
+    while i < len(rows) and top_k > 0:
+        if len(heap) == top_k:
+            # Blok hanya berisi itemset yang batas atasnya masih bisa menyaingi heap
+            i_end = i + int(np.searchsorted(-bound[i:], -heap[0][0], side="right"))
+            if i_end == i:
+                break
+        else:
+            i_end = len(rows)
+        chunk = rows[i:min(i + size, i_end)]
+        max_lift, max_conf, _, _ = scorer.score(chunk)
+        keep = np.isfinite(max_conf)
+        if len(heap) == top_k:
+            keep &= max_lift >= heap[0][0]
+        for lift, conf, row in zip(max_lift[keep], max_conf[keep], chunk[keep]):
+            item = (float(lift), float(conf), -int(rank[row]), int(row))
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heappushpop(heap, item)
+        i += len(chunk)
+        size *= 2
+
+    best = sorted(heap, reverse=True)
+    return (np.array([row for _, _, _, row in best], dtype=np.int64),
+            np.array([lift for lift, _, _, _ in best], dtype=float),
+            np.array([conf for _, conf, _, _ in best], dtype=float))
@@ -0,0 +1,174 @@
+# sampling.py
+import math
+
+import numpy as np
+import pandas as pd
+
+from basket import build_basket_from_chunks, count_itemsets, iter_apriori
+from rules import encode_itemsets, rule_details
+
+
+def sample_size(epsilon: float, delta: float = 0.05) -> int:
+    # Batas Hoeffding: dengan n transaksi sampel, |support sampel - support asli| <= epsilon
+    # untuk satu itemset dengan peluang minimal 1 - delta
+    return math.ceil(math.log(2 / delta) / (2 * epsilon ** 2))
+
+
+def sample_transaksi(chunks, n: int, seed: int = 0):
+    """Sampel acak seragam n Kode Transaksi dari potongan (kode, produk), satu kali baca.
+
+    Setiap kode mendapat prioritas acak tetap (hash kode + seed) dan yang disimpan
+    hanya n kode dengan prioritas terkecil (bottom-k), sehingga baris dari transaksi
+    yang sama selalu ikut atau tidak ikut bersama-sama walaupun terpisah potongan."""
+    hash_key = f"{seed:016d}"[-16:]
+    kode_kept, produk_kept, prio_kept = [], [], np.empty(0, dtype=np.uint64)
+    threshold = None
+    compact_at = 2 * n
+    for kode, produk in chunks:
+        kode = pd.Series(kode).to_numpy(dtype=object)
+        prio = pd.util.hash_array(kode, hash_key=hash_key)
+        keep = prio <= threshold if threshold is not None else np.ones(len(prio), dtype=bool)
+        kode_kept.append(kode[keep])
+        produk_kept.append(pd.Series(produk).to_numpy(dtype=object)[keep])
+        prio_kept = np.concatenate([prio_kept, prio[keep]])
+
+        # Pemadatan ke n kode teratas hanya saat baris tersimpan sudah berlipat,
+        # agar biayanya teramortisasi
+        if len(prio_kept) >= compact_at:
+            unik = np.unique(prio_kept)
+            if len(unik) > n:
+                threshold = unik[n - 1]
+                keep = prio_kept <= threshold
+                kode_all, produk_all = np.concatenate(kode_kept)[keep], np.concatenate(produk_kept)[keep]
+                kode_kept, produk_kept, prio_kept = [kode_all], [produk_all], prio_kept[keep]
+            compact_at = 2 * len(prio_kept)
+    if not kode_kept:
+        return np.empty(0, dtype=object), np.empty(0, dtype=object)
+
+    kode, produk = np.concatenate(kode_kept), np.concatenate(produk_kept)
+    unik = np.unique(prio_kept)
+    if len(unik) > n:
+        keep = prio_kept <= unik[n - 1]
+        kode, produk = kode[keep], produk[keep]
+    return kode, produk
+
+
+def wilson_interval(count, n: int, delta: float = 0.05):
+    # Interval kepercayaan Wilson (1 - delta) untuk proporsi count / n
+    z = _z_score(delta)
+    p = np.asarray(count, dtype=float) / n
+    center = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return center - half, center + half
+
+
+def _z_score(delta: float) -> float:
+    # Kuantil normal baku 1 - delta/2 (inverse erf lewat bisection, tanpa scipy)
+    lo, hi = 0.0, 10.0
+    for _ in range(100):
+        mid = (lo + hi) / 2
+        if math.erfc(mid / math.sqrt(2)) > delta:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+def negative_border(frequent: set, n_produk: int) -> list:
+    # Itemset yang tidak frequent tetapi semua subset ukuran k-1-nya frequent
+    # (Toivonen): jika tidak ada satu pun yang ternyata frequent di data penuh,
+    # maka tidak ada itemset frequent yang terlewat oleh sampel
+    border = [(i,) for i in range(n_produk) if (i,) not in frequent]
+    by_len = {}
+    for itemset in frequent:
+        by_len.setdefault(len(itemset), []).append(itemset)
+    for k in range(2, max(by_len, default=0) + 2):
+        prefixes = {}
+        for itemset in sorted(by_len.get(k - 1, [])):
+            prefixes.setdefault(itemset[:-1], []).append(itemset[-1])
+        for prefix, tails in prefixes.items():
+            for j, a in enumerate(tails):
+                for b in tails[j + 1:]:
+                    cand = prefix + (a, b)
+                    if cand not in frequent and all(cand[:m] + cand[m + 1:] in frequent for m in range(k)):
+                        border.append(cand)
+    return border
+
+
+def _itemsets_frame(products, itemsets: list, support) -> pd.DataFrame:
+    # Urutan sama dengan iter_apriori (per ukuran, lalu id produk) agar urutan seri
+    # di tabel packaging sama dengan mining penuh
+    order = sorted(range(len(itemsets)), key=lambda i: (len(itemsets[i]), itemsets[i]))
+    return pd.DataFrame({
+        "support": [support[i] for i in order],
+        "itemsets": [frozenset(products[list(itemsets[i])]) for i in order],
+    })
+
+
+def sampled_itemsets(chunks, min_support: float, epsilon: float = 0.01, delta: float = 0.05,
+                     seed: int = 0, verify_chunks=None):
+    """Frequent itemset dari sampel transaksi (Toivonen).
+
+    Sampel berukuran sample_size(epsilon, delta) ditambang dengan min_support
+    diturunkan sebesar epsilon. Tanpa `verify_chunks` support yang dikembalikan
+    adalah support sampel. Dengan `verify_chunks` (potongan data penuh) kandidat
+    dan negative border-nya dihitung exact dalam satu kali baca; jika tidak ada
+    border yang frequent (laporan "border_frequent" = 0), hasilnya sama dengan
+    mining penuh. Mengembalikan (itemsets format mlxtend, laporan)."""
+    n = sample_size(epsilon, delta)
+    kode, produk = sample_transaksi(chunks, n, seed)
+    sample = build_basket_from_chunks([(kode, produk)])
+    low = max(min_support - epsilon, min_support / 2)
+    mined = list(iter_apriori(sample, low))
+    report = {
+        "epsilon": epsilon, "delta": delta, "sample_transaksi": sample.n_transaksi,
+        "lowered_min_support": low, "kandidat": len(mined), "verified": verify_chunks is not None,
+    }
+
+    if verify_chunks is None:
+        chosen = [(s, ids) for s, ids in mined if s >= min_support]
+        return _itemsets_frame(sample.products, [ids for _, ids in chosen], [s for s, _ in chosen]), report
+
+    full = build_basket_from_chunks(verify_chunks)
+    # Id produk sampel -> id produk data penuh (keduanya terurut nama)
+    remap = np.searchsorted(full.products, sample.products)
+    candidates = sorted({tuple(int(i) for i in remap[list(ids)]) for _, ids in mined})
+    border = negative_border(set(candidates), len(full.products))
+    counts = count_itemsets(full, candidates + border)
+    min_count = min_support * full.n_transaksi
+    report.update(n_transaksi=full.n_transaksi, border=len(border),
+                  border_frequent=int((counts[len(candidates):] >= min_count).sum()))
+    all_sets = candidates + border
+    keep = [i for i, c in enumerate(counts) if c >= min_count]
+    return _itemsets_frame(full.products, [all_sets[i] for i in keep],
+                           [counts[i] / full.n_transaksi for i in keep]), report
+
+
+def estimate_packaging(itemsets: pd.DataFrame, n_sample: int, delta: float = 0.05,
+                       min_threshold: float = 0.4, top_k: int = None):
+    """Tabel packaging dari support sampel, ditambah interval kepercayaan (1 - delta)
+    Wilson untuk support set dan interval lift konservatif dari interval ketiga
+    support (set, antecedent, consequent) pada rule dengan lift maksimum."""
+    if itemsets.empty:
+        return None
+    enc = encode_itemsets(itemsets)
+    rows, max_lift, max_conf, s_a, s_c = rule_details(enc, min_threshold=min_threshold)
+    if len(rows) == 0:
+        return None
+
+    s_ac = enc.support[rows]
+    ac_lo, ac_hi = wilson_interval(np.round(s_ac * n_sample), n_sample, delta)
+    a_lo, a_hi = wilson_interval(np.round(s_a * n_sample), n_sample, delta)
+    c_lo, c_hi = wilson_interval(np.round(s_c * n_sample), n_sample, delta)
+    order = np.lexsort((enc.name_rank()[rows], -max_conf, -max_lift))[:top_k]
+    return pd.DataFrame({
+        "Packaging Set ID": np.arange(1, len(order) + 1),
+        "Products": enc.names(rows[order]),
+        "Maximum_Lift": max_lift[order],
+        "Maximum_Confidence": max_conf[order],
+        "Support": s_ac[order],
+        "Support_CI_Low": ac_lo[order],
+        "Support_CI_High": ac_hi[order],
+        "Lift_CI_Low": (ac_lo / (a_hi * c_hi))[order],
+        "Lift_CI_High": (ac_hi / (a_lo * c_lo))[order],
+    })
@@ -0,0 +1,57 @@
+# schema_profile.py
+# Profil skema per sumber: kolom tanggal, format dominan dan kosakata nama bulan,
+# disimpan sebagai JSON dengan kunci tanda tangan header. File harian berikutnya
+# dengan tata letak yang sama langsung memakai profil ini tanpa deteksi ulang.
+import glob
+import hashlib
+import json
+import os
+
+PROFILE_VERSION = 2
+
+# Lokasi profil, bisa diatur lewat environment variable (string kosong = nonaktif)
+PROFILE_DIR = os.environ.get("DQMART_SCHEMA_DIR", os.path.join(os.path.expanduser("~"), ".cache", "dqmart", "schema"))
+
+
+def enabled() -> bool:
+    return bool(PROFILE_DIR)
+
+
+def header_signature(columns, sheet_name=None) -> str:
+    # Sumber dikenali dari tata letak header (sheet + nama dan urutan kolom), bukan
+    # dari path, sehingga semua ekspor dari toko/sistem yang sama berbagi satu profil
+    return hashlib.sha1("\0".join(map(str, [sheet_name, *columns])).encode("utf-8")).hexdigest()[:16]
+
+
+def profile_path(signature: str) -> str:
+    return os.path.join(PROFILE_DIR, f"{signature}.json")
+
+
+def load(columns, sheet_name=None):
+    """Profil tersimpan untuk header ini, atau None jika belum ada atau tidak cocok."""
+    target = profile_path(header_signature(columns, sheet_name))
+    try:
+        with open(target, encoding="utf-8") as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Versi berbeda atau header tidak sama persis (tabrakan hash) dianggap belum ada
+    if profile.get("version") != PROFILE_VERSION or profile.get("columns") != [str(c) for c in columns]:
+        return None
+    return profile
+
+
+def save(profile: dict) -> str:
+    # Tulis ke file sementara lalu os.replace agar pembaca lain tidak melihat JSON setengah jadi
+    target = profile_path(profile["signature"])
+    tmp = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(profile, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, target)
+    return target
+
+
+def clear() -> None:
+    for f in glob.glob(os.path.join(PROFILE_DIR, "*.json")):
+        os.remove(f)
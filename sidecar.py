@@ -0,0 +1,109 @@
+# sidecar.py
+import glob
+import hashlib
+import json
+import os
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow opsional; tanpa pyarrow workbook selalu dibaca ulang
+    pa = None
+
+# Lokasi dan batas ukuran cache, bisa diatur lewat environment variable
+CACHE_DIR = os.environ.get("DQMART_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "dqmart"))
+MAX_BYTES = int(os.environ.get("DQMART_CACHE_MAX_BYTES", 1 << 30))
+
+
+def enabled() -> bool:
+    return pa is not None and bool(CACHE_DIR)
+
+
+def _digest(*parts) -> str:
+    return hashlib.sha1("\0".join(map(str, parts)).encode()).hexdigest()[:16]
+
+
+def cache_path(path, sheet_name, mode: str) -> str:
+    # Nama file = <sumber>-<versi>: sumber dari path + sheet + mode baca,
+    # versi dari mtime + ukuran sehingga file yang berubah otomatis tidak cocok lagi
+    st = os.stat(path)
+    source = _digest(os.path.abspath(path), sheet_name, mode)
+    version = _digest(st.st_mtime_ns, st.st_size)
+    return os.path.join(CACHE_DIR, f"{source}-{version}.arrow")
+
+
+def load(path, sheet_name, mode: str, chunksize: int):
+    """Potongan DataFrame dari cache Arrow (memory-mapped), atau None jika belum ada."""
+    target = cache_path(path, sheet_name, mode)
+    if not os.path.exists(target):
+        return None
+    os.utime(target)  # tandai baru dipakai untuk eviksi LRU
+    return _iter_cached(target, chunksize)
+
+
+def _iter_cached(target, chunksize):
+    with pa.memory_map(target) as source:
+        table = pa.ipc.open_file(source).read_all()
+        # Nama kolom asli (Arrow menyimpan semua nama sebagai teks, mis. header 2024)
+        meta = (table.schema.metadata or {}).get(b"dqmart_columns")
+        names = json.loads(meta) if meta else None
+        # Tabel tanpa baris tetap satu potongan kosong agar header tidak hilang
+        for start in range(0, max(table.num_rows, 1), chunksize):
+            chunk = table.slice(start, chunksize).to_pandas()
+            yield chunk.set_axis(names, axis=1) if names else chunk
+
+
+def store(path, sheet_name, mode: str, chunks):
+    """Teruskan `chunks` apa adanya sambil menulis salinan Arrow ke cache.
+
+    Jika ada potongan yang tidak bisa dikonversi ke Arrow (mis. kolom campuran
+    tanggal dan teks), cache dibatalkan tetapi pembacaan tetap berjalan."""
+    target = cache_path(path, sheet_name, mode)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    writer, schema, ok = None, None, True
+    try:
+        for chunk in chunks:
+            if ok:
+                try:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        schema = table.schema.with_metadata({
+                            **(table.schema.metadata or {}),
+                            b"dqmart_columns": json.dumps(list(chunk.columns), default=str).encode(),
+                        })
+                        writer = pa.ipc.new_file(tmp, schema)
+                    writer.write_table(table.cast(schema))
+                except (pa.ArrowException, ValueError, TypeError):
+                    ok = False
+            yield chunk
+        if writer is not None:
+            writer.close()
+            writer = None
+            if ok:
+                # Versi lama dari sumber yang sama langsung dibuang
+                for old in glob.glob(target.rsplit("-", 1)[0] + "-*.arrow"):
+                    os.remove(old)
+                os.replace(tmp, target)
+                evict()
+    finally:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def evict(max_bytes: int = None) -> None:
+    # Hapus file cache yang paling lama tidak dipakai sampai total ukuran <= max_bytes
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    files = [(os.stat(f), f) for f in glob.glob(os.path.join(CACHE_DIR, "*.arrow"))]
+    total = sum(st.st_size for st, _ in files)
+    for st, f in sorted(files, key=lambda x: x[0].st_mtime):
+        if total <= max_bytes:
+            break
+        os.remove(f)
+        total -= st.st_size
+
+
+def clear() -> None:
+    evict(0)
@@ -0,0 +1,82 @@
+# son.py
+# Contoh: son_itemsets(basket, min_support=0.01, workers=8)
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from basket import Basket, count_itemsets, frequent_itemsets, iter_apriori, iter_eclat
+from parallel import imap_ordered
+
+
+def partition_bounds(n_transaksi: int, n_partitions: int) -> list:
+    # Rentang id transaksi [lo, hi) yang berurutan (urutan Kode Transaksi di file),
+    # batasnya kelipatan 64 agar setiap partisi tepat satu potongan word bitset
+    words = (n_transaksi + 63) // 64
+    n_partitions = max(1, min(n_partitions, words))
+    cuts = [min(64 * (words * p // n_partitions), n_transaksi) for p in range(n_partitions + 1)]
+    return [(lo, hi) for lo, hi in zip(cuts[:-1], cuts[1:]) if hi > lo]
+
+
+def _local_candidates(part: Basket, min_support: float, algorithm: str, max_len) -> list:
+    # Fase 1: itemset frequent lokal satu partisi (sebagai tuple id produk)
+    if algorithm == "apriori":
+        return [ids for _, ids in iter_apriori(part, min_support, max_len)]
+    if algorithm == "eclat":
+        return [ids for _, ids in iter_eclat(part, min_support, max_len)]
+    itemsets = frequent_itemsets(part, min_support, max_len=max_len, algorithm=algorithm)
+    return [tuple(int(i) for i in np.searchsorted(part.products, sorted(s))) for s in itemsets["itemsets"]]
+
+
+def _count_partition(part: Basket, candidates: list) -> np.ndarray:
+    # Fase 2: support count exact semua kandidat pada satu partisi
+    return count_itemsets(part, candidates)
+
+
+def _eclat_order(frequent: set, singles: list) -> list:
+    # Urutan keluaran iter_eclat untuk himpunan itemset frequent yang sudah diketahui
+    order = [(i,) for i in singles]
+    stack = [((i,), singles[j + 1:]) for j, i in enumerate(singles)]
+    while stack:
+        prefix, tails = stack.pop()
+        ext = [t for t in tails if prefix + (t,) in frequent]
+        for n, t in enumerate(ext):
+            order.append(prefix + (t,))
+            stack.append((prefix + (t,), ext[n + 1:]))
+    return order
+
+
+def son_itemsets(basket: Basket, min_support: float, workers: int = 2, partitions: int = None,
+                 algorithm: str = "apriori", max_len=None) -> pd.DataFrame:
+    """Frequent itemset dengan algoritma SON (dua fase) di `workers` proses.
+
+    Fase 1 menambang setiap partisi transaksi secara lokal dengan min_support yang
+    sama; itemset yang frequent secara global pasti frequent di minimal satu
+    partisi, jadi gabungan hasil lokal memuat semua kandidat. Fase 2 menghitung
+    support exact semua kandidat per partisi lalu menjumlahkannya. Hasil dan
+    urutannya sama dengan frequent_itemsets serial (apriori/eclat). Untuk fpgrowth
+    isi dan support sama tetapi urutan baris mengikuti apriori; tabel packaging
+    tetap identik karena seri di build_packaging diputus menurut nama produk."""
+    if basket.n_transaksi == 0:
+        return pd.DataFrame(columns=["support", "itemsets"])
+    bounds = partition_bounds(basket.n_transaksi, partitions or workers)
+
+    # Fase 1: threshold lokal sedikit dilonggarkan agar pembulatan float pada
+    # min_support * ukuran partisi tidak membuang kandidat di batas
+    local = partial(_local_candidates, min_support=min_support * (1 - 1e-9), algorithm=algorithm, max_len=max_len)
+    parts = (basket.window(lo, hi) for lo, hi in bounds)
+    candidates = sorted(set().union(*imap_ordered(local, parts, workers)), key=lambda ids: (len(ids), ids))
+
+    # Fase 2: hitung ulang di data penuh, threshold sama dengan iter_apriori
+    parts = (basket.window(lo, hi) for lo, hi in bounds)
+    counts = sum(imap_ordered(partial(_count_partition, candidates=candidates), parts, workers))
+    min_count = min_support * basket.n_transaksi
+    support = {ids: c / basket.n_transaksi for ids, c in zip(candidates, counts) if c >= min_count}
+
+    order = [ids for ids in candidates if ids in support]
+    if algorithm == "eclat":
+        order = _eclat_order(set(support), [ids[0] for ids in order if len(ids) == 1])
+    return pd.DataFrame({
+        "support": [support[ids] for ids in order],
+        "itemsets": [frozenset(basket.products[list(ids)]) for ids in order],
+    }, columns=["support", "itemsets"])
@@ -0,0 +1,91 @@
+# windows.py
+# Contoh: run_windowed_analysis("penjualan_normalized.xlsx", "packaging_bulanan.xlsx", freq="M")
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from apriori_hackathon import build_packaging
+from basket import build_basket_sorted, frequent_itemsets
+from ingest import read_chunks
+from output import write_sheets
+from parallel import imap_ordered
+
+KOLOM = ["Kode Transaksi", "Nama Produk", "Tanggal Transaksi"]
+
+
+def read_transaksi_bertanggal(input_path: str, sheet_name: str = "transaksi"):
+    # Kode, produk dan tanggal dari output normalize_tanggal_transaksi (dd-mm-YYYY);
+    # tanggal yang tidak bisa dibaca menjadi NaT dan transaksinya dilewati
+    chunks = [c.dropna() for c in read_chunks(input_path, sheet_name=sheet_name, columns=KOLOM)]
+    df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=KOLOM)
+    tanggal = pd.to_datetime(df["Tanggal Transaksi"].astype(str), format="%d-%m-%Y", errors="coerce")
+    return df["Kode Transaksi"], df["Nama Produk"].astype(str).str.strip(), tanggal
+
+
+def make_windows(tanggal, freq: str = "M", window=None, step=None) -> list:
+    # Daftar (label, awal, akhir) dengan akhir eksklusif.
+    # Tumbling: satu jendela per periode pandas (freq "W", "M", "Q", ...).
+    # Sliding: jendela sepanjang `window` (mis. "28D") yang bergeser setiap `step`.
+    tanggal = pd.DatetimeIndex(tanggal).dropna()
+    if len(tanggal) == 0:
+        return []
+    first, last = tanggal.min(), tanggal.max()
+    if window is None:
+        windows = []
+        for p in pd.period_range(first, last, freq=freq):
+            label = str(p) if "/" not in str(p) else f"{p.start_time:%Y-%m-%d}"
+            windows.append((label, p.start_time, (p + 1).start_time))
+        return windows
+
+    window, step = pd.Timedelta(window), pd.Timedelta(step or window)
+    return [(f"{s:%Y-%m-%d}", s, s + window) for s in pd.date_range(first.normalize(), last, freq=step)]
+
+
+def _mine_window(item, min_support, algorithm, top_k):
+    label, basket = item
+    itemsets = frequent_itemsets(basket, min_support=min_support, algorithm=algorithm)
+    return build_packaging(itemsets, top_k=top_k)
+
+
+def run_windowed_analysis(input_path: str, output_path: str, freq: str = "M", window=None, step=None,
+                          min_support: float = 0.05, algorithm: str = "apriori", top_k: int = None,
+                          workers: int = 1, sheet_name: str = "transaksi", output_format: str = None) -> None:
+    """Packaging per jendela waktu berdasarkan Tanggal Transaksi.
+
+    File dibaca dan basket dibangun sekali dengan transaksi diurutkan per tanggal,
+    sehingga setiap jendela cukup berupa potongan bitset (Basket.window). Jendela
+    ditambang paralel di `workers` proses. Output: sheet "Gabungan" (format panjang,
+    semua jendela) lalu satu sheet Packaging per jendela."""
+    kode, produk, tanggal = read_transaksi_bertanggal(input_path, sheet_name)
+    basket, tkey = build_basket_sorted(kode, produk, tanggal)
+
+    windows = []
+    for label, start, end in make_windows(tkey, freq, window, step):
+        lo, hi = np.searchsorted(tkey, [np.datetime64(start), np.datetime64(end)])
+        if hi > lo:
+            windows.append((label, start, end, int(lo), int(hi)))
+
+    items = ((label, basket.window(lo, hi)) for label, _, _, lo, hi in windows)
+    task = partial(_mine_window, min_support=min_support, algorithm=algorithm, top_k=top_k)
+
+    sheets, gabungan = {}, []
+    for (label, start, end, lo, hi), packaging in zip(windows, imap_ordered(task, items, workers)):
+        if packaging is None:
+            continue
+        sheets[f"Packaging_{label}"] = packaging
+        gabungan.append(packaging.assign(
+            **{"Window": label,
+               "Window Start": f"{start:%d-%m-%Y}",
+               "Window End": f"{end - pd.Timedelta(days=1):%d-%m-%Y}",
+               "Jumlah Transaksi": hi - lo}
+        ))
+
+    if not sheets:
+        print("Tidak ada kombinasi yang memenuhi kriteria.")
+        return
+    kolom = ["Window", "Window Start", "Window End", "Jumlah Transaksi",
+             "Packaging Set ID", "Products", "Maximum_Lift", "Maximum_Confidence"]
+    gabungan = pd.concat(gabungan, ignore_index=True)[kolom]
+    paths = write_sheets({"Gabungan": gabungan, **sheets}, output_path, output_format)
+    print(f"[OK] Hasil {len(sheets)} jendela disimpan ke: {', '.join(paths)}")
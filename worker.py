@@ -0,0 +1,284 @@
+# worker.py
+# Worker lokal yang tetap hangat (pandas, tabel bulan, regex dan parse cache sudah dimuat):
+#   python worker.py --port 8765
+#   WorkerClient("http://127.0.0.1:8765").dates(["17 Desember 2024", "2024, 6 Nov"])
+# Endpoint (JSON): POST /dates, POST /keterangan {"values": [...]}, POST /file
+# {"pipeline": "dates"|"keterangan", "input": ..., "output": ..., "options": {...}}, GET /stats
+import argparse
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Pipeline file yang dilayani worker -> (modul, fungsi), seperti batch.PIPELINES
+FILE_PIPELINES = {
+    "dates": ("date_standardization", "normalize_tanggal_transaksi"),
+    "keterangan": ("parse_and_map", "process_excel"),
+}
+
+
+class MicroBatcher:
+    """Gabungkan request yang datang bersamaan menjadi satu panggilan fungsi vektor.
+
+    Request pertama menunggu paling lama `max_wait` detik (atau sampai `max_rows`
+    nilai terkumpul) untuk request lain; semua nilai lalu diproses sekali dan
+    hasilnya dibagi kembali sesuai urutan per request."""
+
+    def __init__(self, func, max_wait: float = 0.002, max_rows: int = 50_000):
+        self.func = func
+        self.max_wait = max_wait
+        self.max_rows = max_rows
+        self.batches = 0
+        self.requests = 0
+        self._queue = queue.Queue()
+        threading.Thread(target=self._loop, daemon=True).start()
+
+    def submit(self, values: list) -> Future:
+        future = Future()
+        self._queue.put((values, future))
+        return future
+
+    def _loop(self):
+        while True:
+            items = [self._queue.get()]
+            try:
+                rows = len(items[0][0])
+                deadline = time.monotonic() + self.max_wait
+                while rows < self.max_rows:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    items.append(item)
+                    rows += len(item[0])
+                self._run(items)
+            except Exception as e:  # thread batcher tidak boleh mati; request yang tertunda diberi error
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _call(self, values: list) -> list:
+        import pandas as pd
+        return [None if pd.isna(v) else v for v in self.func(pd.Series(values, dtype=object)).tolist()]
+
+    def _run(self, items):
+        self.batches += 1
+        self.requests += len(items)
+        try:
+            hasil = self._call([v for vals, _ in items for v in vals])
+        except Exception:
+            # Batch gagal: ulangi per request agar hanya request yang bermasalah mendapat error
+            for vals, future in items:
+                try:
+                    future.set_result(self._call(vals))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        pos = 0
+        for vals, future in items:
+            future.set_result(hasil[pos:pos + len(vals)])
+            pos += len(vals)
+
+
+class _Latency:
+    # Latensi request terakhir (jendela terbatas) dan total request/baris per endpoint
+    def __init__(self, maxlen: int = 10_000):
+        self.samples = deque(maxlen=maxlen)
+        self.count = 0
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float, rows: int) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+            self.count += 1
+            self.rows += rows
+
+    def summary(self, uptime: float) -> dict:
+        import numpy as np
+        with self._lock:
+            samples = np.asarray(self.samples)
+            count, rows = self.count, self.rows
+        return {
+            "requests": count,
+            "rows": rows,
+            "p50_ms": round(float(np.percentile(samples, 50)) * 1000, 3) if len(samples) else None,
+            "p99_ms": round(float(np.percentile(samples, 99)) * 1000, 3) if len(samples) else None,
+            "requests_per_s": round(count / uptime, 1),
+            "rows_per_s": round(rows / uptime, 1),
+        }
+
+
+class WorkerServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, max_wait: float = 0.002, max_rows: int = 50_000):
+        super().__init__(address, _Handler)
+        from date_standardization import normalize_dates
+        from parse_and_map import extract_dates
+
+        self.started = time.monotonic()
+        self.batchers = {
+            "dates": MicroBatcher(normalize_dates, max_wait, max_rows),
+            "keterangan": MicroBatcher(extract_dates, max_wait, max_rows),
+        }
+        self.latency = {name: _Latency() for name in ("dates", "keterangan", "file")}
+        # Pemanasan: regex, tabel bulan, pyarrow dan jalur pd.to_datetime dimuat sekarang
+        for batcher in self.batchers.values():
+            batcher.submit(["17 Desember 2024", "2024, 6 Nov", "Susi berangkat kerja tanggal 25 Juni '24"]).result()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def stats(self) -> dict:
+        from date_standardization import parse_stats
+        from parse_cache import cache_stats
+
+        uptime = time.monotonic() - self.started
+        return {
+            "uptime_s": round(uptime, 1),
+            "endpoints": {name: lat.summary(uptime) for name, lat in self.latency.items()},
+            "batches": {name: {"batches": b.batches, "requests": b.requests,
+                               "requests_per_batch": round(b.requests / b.batches, 2) if b.batches else None}
+                        for name, b in self.batchers.items()},
+            "parse_stats": parse_stats(),
+            "parse_cache": cache_stats(),
+        }
+
+    def run_file(self, request: dict) -> dict:
+        import importlib
+        if request.get("pipeline") not in FILE_PIPELINES:
+            raise ValueError(f"Pipeline '{request.get('pipeline')}' tidak dikenal, pilih salah satu dari "
+                             f"{list(FILE_PIPELINES)}.")
+        module, func = FILE_PIPELINES[request["pipeline"]]
+        getattr(importlib.import_module(module), func)(request["input"], request["output"], **request.get("options", {}))
+        return {"output": request["output"]}
+
+
+def _nilai_valid(value) -> bool:
+    # Nilai sel yang bisa diproses normalize_dates/extract_dates (bool ditolak)
+    return value is None or (isinstance(value, (str, int, float)) and not isinstance(value, bool))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 agar koneksi klien tetap terbuka antar request (keep-alive)
+    protocol_version = "HTTP/1.1"
+    # wfile di-buffer (di-flush sekali per request) dan TCP_NODELAY: header dan body
+    # keluar dalam satu send(), tanpa jeda Nagle/delayed ACK ~40 ms per respons
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._reply(200, self.server.stats())
+        else:
+            self._reply(404, {"error": f"Endpoint '{self.path}' tidak dikenal."})
+
+    def do_POST(self):
+        start = time.perf_counter()
+        name = self.path.strip("/")
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            if name in self.server.batchers:
+                values = request.get("values")
+                if not isinstance(values, list) or not all(_nilai_valid(v) for v in values):
+                    raise ValueError("'values' harus berupa list berisi teks, angka atau null.")
+                payload, rows = {"hasil": self.server.batchers[name].submit(values).result()}, len(values)
+            elif name == "file":
+                payload, rows = self.server.run_file(request), 0
+            else:
+                self._reply(404, {"error": f"Endpoint '{self.path}' tidak dikenal."})
+                return
+        except Exception as e:
+            self._reply(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self.server.latency[name].add(time.perf_counter() - start, rows)
+        self._reply(200, payload)
+
+
+def start_worker(host: str = "127.0.0.1", port: int = 0, max_wait_ms: float = 2.0, max_rows: int = 50_000):
+    # Jalankan worker di thread latar (port 0 = port bebas); kembalikan server (lihat .url)
+    server = WorkerServer((host, port), max_wait_ms / 1000, max_rows)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class WorkerClient:
+    """Klien worker dengan satu koneksi keep-alive (satu klien per thread)."""
+
+    def __init__(self, url: str = "http://127.0.0.1:8765", timeout: float = 60):
+        parts = urlsplit(url)
+        self._conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+
+    def _request(self, method: str, path: str, payload: dict = None) -> dict:
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {} if body is None else {"Content-Type": "application/json"}
+        self._conn.request(method, path, body=body, headers=headers)
+        response = self._conn.getresponse()
+        hasil = json.loads(response.read())
+        if response.status != 200:
+            raise RuntimeError(hasil.get("error", f"HTTP {response.status}"))
+        return hasil
+
+    def dates(self, values: list) -> list:
+        return self._request("POST", "/dates", {"values": list(values)})["hasil"]
+
+    def keterangan(self, values: list) -> list:
+        return self._request("POST", "/keterangan", {"values": list(values)})["hasil"]
+
+    def run_file(self, pipeline: str, input_path: str, output_path: str, **options) -> dict:
+        return self._request("POST", "/file", {"pipeline": pipeline, "input": input_path,
+                                               "output": output_path, "options": options})
+
+    def stats(self) -> dict:
+        return self._request("GET", "/stats")
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, max_wait_ms: float = 2.0, max_rows: int = 50_000) -> None:
+    # Hanya untuk localhost: endpoint /file membaca dan menulis path apa pun di mesin ini
+    server = WorkerServer((host, port), max_wait_ms / 1000, max_rows)
+    print(f"[OK] Worker siap di {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 = port bebas")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="waktu tunggu maksimum untuk mengisi batch")
+    parser.add_argument("--max-rows", type=int, default=50_000, help="nilai maksimum per batch")
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.max_wait_ms, args.max_rows)
+
+
+if __name__ == "__main__":
+    main()